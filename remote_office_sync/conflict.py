@@ -3,7 +3,7 @@
 import hashlib
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 from remote_office_sync.logging_setup import get_logger
 from remote_office_sync.scanner import FileMetadata
@@ -59,7 +59,23 @@ class ConflictDetector:
         Returns:
             Dict mapping file path to (ConflictType, prev_metadata, curr_metadata)
         """
-        conflicts = {}
+        return {
+            path: (conflict_type, prev_metadata, curr_metadata)
+            for path, conflict_type, prev_metadata, curr_metadata in self.iter_conflicts()
+        }
+
+    def iter_conflicts(
+        self,
+    ) -> Iterator[Tuple[str, ConflictType, Optional[FileMetadata], FileMetadata]]:
+        """Yield conflicts between current and previous state one path at a time.
+
+        Paths are yielded in current-state order, each at most once with its final
+        conflict type.
+
+        Yields:
+            Tuples of (path, ConflictType, prev_metadata, curr_metadata)
+        """
+        count = 0
 
         for path, curr_metadata in self.current_state.items():
             # Skip directories
@@ -73,44 +89,51 @@ class ConflictDetector:
                 if curr_metadata.exists_left and curr_metadata.exists_right:
                     if not self._is_same_content(curr_metadata):
                         logger.debug(
-                            f"NEW_NEW conflict for {path}: "
-                            f"left_size={curr_metadata.size_left}, "
-                            f"right_size={curr_metadata.size_right}, "
-                            f"left_mtime={curr_metadata.mtime_left}, "
-                            f"right_mtime={curr_metadata.mtime_right}"
+                            "NEW_NEW conflict for %s: left_size=%s, right_size=%s, left_mtime=%s,"
+                            " right_mtime=%s",
+                            path,
+                            curr_metadata.size_left,
+                            curr_metadata.size_right,
+                            curr_metadata.mtime_left,
+                            curr_metadata.mtime_right,
                         )
-                        conflicts[path] = (ConflictType.NEW_NEW, None, curr_metadata)
+                        count += 1
+                        yield path, ConflictType.NEW_NEW, None, curr_metadata
                 continue
 
+            conflict_type = None
+
             # Track which sides show a timestamp bump
             left_changed = False
             right_changed = False
 
             if curr_metadata.exists_left and prev_metadata.mtime_left:
-                left_changed = (curr_metadata.mtime_left or 0) > prev_metadata.mtime_left
+                left_changed = curr_metadata.mtime_left > prev_metadata.mtime_left
 
             if curr_metadata.exists_right and prev_metadata.mtime_right:
-                right_changed = (curr_metadata.mtime_right or 0) > prev_metadata.mtime_right
+                right_changed = curr_metadata.mtime_right > prev_metadata.mtime_right
 
             # Check for modify-modify conflict
             if left_changed and right_changed:
                 if not self._is_same_content(curr_metadata):
                     logger.debug(
-                        f"MODIFY_MODIFY conflict for {path}: "
-                        f"prev: left_mtime={prev_metadata.mtime_left}, "
-                        f"right_mtime={prev_metadata.mtime_right}, "
-                        f"curr: left_mtime={curr_metadata.mtime_left}, "
-                        f"right_mtime={curr_metadata.mtime_right}"
+                        "MODIFY_MODIFY conflict for %s: prev: left_mtime=%s, right_mtime=%s, "
+                        "curr: left_mtime=%s, right_mtime=%s",
+                        path,
+                        prev_metadata.mtime_left,
+                        prev_metadata.mtime_right,
+                        curr_metadata.mtime_left,
+                        curr_metadata.mtime_right,
                     )
-                    conflicts[path] = (ConflictType.MODIFY_MODIFY, prev_metadata, curr_metadata)
+                    conflict_type = ConflictType.MODIFY_MODIFY
 
             # Check for metadata conflicts
             if self._has_metadata_conflict(path, prev_metadata, curr_metadata):
-                conflicts[path] = (ConflictType.METADATA_CONFLICT, prev_metadata, curr_metadata)
+                conflict_type = ConflictType.METADATA_CONFLICT
 
             # Catch equal-mtime/size-but-different-bytes scenarios
             if (
-                path not in conflicts
+                conflict_type is None
                 and curr_metadata.exists_left
                 and curr_metadata.exists_right
                 and not left_changed
@@ -118,13 +141,17 @@ class ConflictDetector:
                 and not self._is_same_content(curr_metadata)
             ):
                 logger.debug(
-                    f"Content divergence detected for {path} with stable "
-                    "mtimes/sizes; treating as modify-modify"
+                    "Content divergence detected for %s with stable mtimes/sizes; treating as "
+                    "modify-modify",
+                    path,
                 )
-                conflicts[path] = (ConflictType.MODIFY_MODIFY, prev_metadata, curr_metadata)
+                conflict_type = ConflictType.MODIFY_MODIFY
+
+            if conflict_type is not None:
+                count += 1
+                yield path, conflict_type, prev_metadata, curr_metadata
 
-        logger.info(f"Detected {len(conflicts)} conflicts")
-        return conflicts
+        logger.info("Detected %s conflicts", count)
 
     def _was_modified_both_sides(self, path: str, prev: FileMetadata, curr: FileMetadata) -> bool:
         """Check if file was modified on both sides since last sync.
@@ -142,11 +169,11 @@ class ConflictDetector:
 
         # Check left side change
         if curr.exists_left and prev.mtime_left:
-            left_changed = (curr.mtime_left or 0) > prev.mtime_left
+            left_changed = curr.mtime_left > prev.mtime_left
 
         # Check right side change
         if curr.exists_right and prev.mtime_right:
-            right_changed = (curr.mtime_right or 0) > prev.mtime_right
+            right_changed = curr.mtime_right > prev.mtime_right
 
         return left_changed and right_changed
 
@@ -164,7 +191,7 @@ class ConflictDetector:
 
         # First pass: same size and mtime within tolerance (cheap)
         same_size = metadata.size_left == metadata.size_right
-        mtime_diff = abs((metadata.mtime_left or 0) - (metadata.mtime_right or 0))
+        mtime_diff = abs(metadata.mtime_left - metadata.mtime_right)
         same_mtime = mtime_diff < self.mtime_tolerance
 
         if not (same_size and same_mtime):
@@ -196,10 +223,10 @@ class ConflictDetector:
                     h.update(chunk)
             return h.hexdigest()
         except FileNotFoundError:
-            logger.debug(f"Hash skipped, file missing: {path}")
+            logger.debug("Hash skipped, file missing: %s", path)
             return None
         except Exception as exc:
-            logger.warning(f"Hash failed for {path}: {exc}")
+            logger.warning("Hash failed for %s: %s", path, exc)
             return None
 
     def _has_metadata_conflict(self, path: str, prev: FileMetadata, curr: FileMetadata) -> bool:
@@ -251,8 +278,8 @@ class ConflictDetector:
 
         if policy == ConflictResolution.OVERWRITE_NEWER:
             # Use modification time to determine which is newer
-            left_mtime = metadata.mtime_left or 0
-            right_mtime = metadata.mtime_right or 0
+            left_mtime = metadata.mtime_left
+            right_mtime = metadata.mtime_right
 
             if left_mtime > right_mtime:
                 return "COPY_LEFT_TO_RIGHT"
@@ -83,7 +83,7 @@ class DryRunFormatter:
         output.append("-" * 80)
         for action, action_jobs in grouped.items():
             symbol = self.ACTION_SYMBOLS.get(action, "?")
-            desc = self.ACTION_DESCRIPTIONS.get(action, str(action))
+            desc = self.ACTION_DESCRIPTIONS.get(action, action.name)
             output.append(f"  {symbol} {desc}: {len(action_jobs)} files")
         output.append("")
 
@@ -95,7 +95,7 @@ class DryRunFormatter:
             if not action_jobs:
                 continue
 
-            output.append(f"\n{self.ACTION_DESCRIPTIONS.get(action, str(action))}:")
+            output.append(f"\n{self.ACTION_DESCRIPTIONS.get(action, action.name)}:")
             output.append("")
 
             for job in action_jobs:
@@ -182,7 +182,7 @@ class DryRunFormatter:
             return f"  [{self.right_name}] {filename} {symbol} (delete directory)"
 
         else:
-            return f"  {filename} ({job.action})"
+            return f"  {filename} ({job.action.name})"
 
     def _format_no_changes(self) -> str:
         """Format output when no changes are needed.
@@ -23,7 +23,7 @@ from remote_office_sync.logging_setup import get_logger, setup_logging
 from remote_office_sync.scanner import FileMetadata, Scanner
 from remote_office_sync.soft_delete import SoftDeleteManager
 from remote_office_sync.state_db import StateDB
-from remote_office_sync.sync_logic import SyncAction, SyncEngine
+from remote_office_sync.sync_logic import CaseConflictPayload, SyncAction, SyncEngine
 
 logger = get_logger()
 
@@ -289,7 +289,7 @@ class SyncRunner:
             elif job.action == SyncAction.CLASH_CREATE:
                 # Create clash file from the older version, keep newer as main
                 # Prefer live filesystem stats to avoid stale DB data; fall back to DB
-                current = self.state_db.load_state().get(job.file_path)
+                current = self.state_db.get_file_state(job.file_path)
                 left_exists = left_path.exists()
                 right_exists = right_path.exists()
                 left_mtime = (
@@ -414,13 +414,15 @@ class SyncRunner:
                     )
 
                 try:
-                    payload = getattr(job, "payload", None) or {}
+                    payload = getattr(job, "payload", None) or CaseConflictPayload(
+                        prev_path=job.file_path
+                    )
 
                     # Prefer captured mtimes/content from job creation to avoid later mutations
-                    left_mtime = payload.get("left_mtime")
-                    right_mtime = payload.get("right_mtime")
-                    left_bytes = payload.get("left_bytes")
-                    right_bytes = payload.get("right_bytes")
+                    left_mtime = payload.left_mtime
+                    right_mtime = payload.right_mtime
+                    left_bytes = payload.left_bytes
+                    right_bytes = payload.right_bytes
 
                     if left_mtime is None:
                         left_mtime = (
@@ -659,7 +661,7 @@ class SyncRunner:
                     )
 
                 # Record conflict alert
-                current = self.state_db.load_state().get(job.file_path)
+                current = self.state_db.get_file_state(job.file_path)
                 if current:
                     self.conflict_alerts.append(
                         ConflictAlert(
@@ -937,7 +939,10 @@ def main() -> int:
             runner.config._config["dry_run"] = False
 
         # Run sync
-        success = runner.run()
+        try:
+            success = runner.run()
+        finally:
+            runner.state_db.close()
         return 0 if success else 1
     except KeyboardInterrupt:
         logger.info("Sync interrupted by user")
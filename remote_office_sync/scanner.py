@@ -1,28 +1,34 @@
 """Directory scanner for file metadata collection."""
 
 import ctypes
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from remote_office_sync.logging_setup import get_logger
 
 logger = get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMetadata:
-    """Metadata for a single file or directory."""
+    """Metadata for a single file or directory.
+
+    Fields for a side the item does not exist on hold zero sentinels rather than None;
+    check exists_left/exists_right before trusting a side's mtime, size or attrs.
+    """
 
     relative_path: str
     exists_left: bool
     exists_right: bool
-    mtime_left: float | None = None
-    mtime_right: float | None = None
-    size_left: int | None = None
-    size_right: int | None = None
-    attrs_left: int | None = None
-    attrs_right: int | None = None
+    mtime_left: float = 0.0
+    mtime_right: float = 0.0
+    size_left: int = 0
+    size_right: int = 0
+    attrs_left: int = 0
+    attrs_right: int = 0
 
     def __hash__(self) -> int:
         """Hash by relative path."""
@@ -39,6 +45,60 @@ class FileMetadata:
         return self.size_left == -1 if self.exists_left else self.size_right == -1
 
 
+def _both_sides(
+    path: str, left: tuple[float, int, int], right: tuple[float, int, int]
+) -> FileMetadata:
+    """Build metadata for an item present on both sides."""
+    return FileMetadata(
+        relative_path=path,
+        exists_left=True,
+        exists_right=True,
+        mtime_left=left[0],
+        mtime_right=right[0],
+        size_left=left[1],
+        size_right=right[1],
+        attrs_left=left[2],
+        attrs_right=right[2],
+    )
+
+
+def _left_only(path: str, left: tuple[float, int, int]) -> FileMetadata:
+    """Build metadata for an item present only on the left side."""
+    return FileMetadata(
+        relative_path=path,
+        exists_left=True,
+        exists_right=False,
+        mtime_left=left[0],
+        size_left=left[1],
+        attrs_left=left[2],
+    )
+
+
+def _right_only(path: str, right: tuple[float, int, int]) -> FileMetadata:
+    """Build metadata for an item present only on the right side."""
+    return FileMetadata(
+        relative_path=path,
+        exists_left=False,
+        exists_right=True,
+        mtime_right=right[0],
+        size_right=right[1],
+        attrs_right=right[2],
+    )
+
+
+def _with_attrs(
+    scan: Dict[str, tuple[float, int] | tuple[float, int, int]],
+) -> Dict[str, tuple[float, int, int]]:
+    """Return scan with every (mtime, size) tuple padded to (mtime, size, 0).
+
+    scan is returned as-is when every tuple already carries attrs, which is always the
+    case for scan_directory results.
+    """
+    if all(len(info) > 2 for info in scan.values()):
+        return scan
+    return {path: info if len(info) > 2 else (*info, 0) for path, info in scan.items()}
+
+
 class Scanner:
     """Scans directories and builds metadata snapshots."""
 
@@ -62,31 +122,25 @@ class Scanner:
         self.ignore_filenames_exact = set(f for f in (ignore_filenames_exact or []) if f)
         # Normalize directory names to lowercase for case-insensitive comparison on Windows
         self.ignore_directories = set(d.lower() for d in (ignore_directories or []) if d)
+        # Tuples let str.startswith/endswith test every rule in a single call
+        self._prefix_tuple = tuple(self.ignore_filenames_prefix)
+        self._ext_tuple = tuple(self.ignore_extensions)
 
     def _should_ignore(self, filename: str) -> bool:
         """Check if file should be ignored."""
-        # Check exact filename match (case-sensitive)
-        if filename in self.ignore_filenames_exact:
-            return True
-
-        # Check prefix match (case-sensitive)
-        for prefix in self.ignore_filenames_prefix:
-            if filename.startswith(prefix):
-                return True
-
-        # Check extension match (case-sensitive)
-        for ext in self.ignore_extensions:
-            if filename.endswith(ext):
-                return True
-
-        return False
+        # Exact, prefix and extension matches are all case-sensitive
+        return (
+            filename in self.ignore_filenames_exact
+            or filename.startswith(self._prefix_tuple)
+            or filename.endswith(self._ext_tuple)
+        )
 
     def _should_ignore_directory(self, dir_name: str) -> bool:
         """Check if directory should be ignored (case-insensitive on Windows)."""
         return dir_name.lower() in self.ignore_directories
 
     @staticmethod
-    def get_file_attributes(path: Path) -> int:
+    def get_file_attributes(path: Path | str) -> int:
         """Get Windows file attributes as bitmask.
 
         Windows attribute constants:
@@ -135,7 +189,7 @@ class Scanner:
 
             return result
         except Exception as e:
-            logger.debug(f"Could not get attributes for {path}: {e}")
+            logger.debug("Could not get attributes for %s: %s", path, e)
             return 0
 
     def scan_directory(self, root_path: str) -> Dict[str, tuple[float, int, int]]:
@@ -149,66 +203,98 @@ class Scanner:
             For directories: size is -1 (sentinel value), attrs is 0
         """
         result = {}
-        root = Path(root_path)
 
-        if not root.exists():
-            logger.warning(f"Directory does not exist: {root_path}")
+        if not os.path.exists(root_path):
+            logger.warning("Directory does not exist: %s", root_path)
             return result
 
         try:
-            for file_path in root.rglob("*"):
-                # Check if any parent directory in the path should be ignored
-                relative_path = file_path.relative_to(root)
-
-                # Normalize path separators to forward slashes early
-                # Preserve original case - Windows supports case changes
-                relative_path_str = str(relative_path).replace("\\", "/")
-
-                should_skip = False
-                for part in relative_path.parts[:-1]:  # Check all directories, not the file itself
-                    if self._should_ignore_directory(part):
-                        logger.debug(f"Skipping path in ignored directory: {relative_path_str}")
-                        should_skip = True
-                        break
+            # update() consumes the (path, info) pairs in C and keeps whatever was
+            # inserted before an error, so a partial scan is still returned
+            result.update(self._walk(root_path, ""))
+        except (OSError, IOError) as e:
+            logger.error("Error scanning directory %s: %s", root_path, e)
 
-                if should_skip:
-                    continue
+        logger.info("Scanned %s items (files and empty directories) in %s", len(result), root_path)
+        return result
 
-                if file_path.is_file():
+    def _walk(self, dir_path: str, rel_prefix: str) -> Iterator[tuple[str, tuple[float, int, int]]]:
+        """Recursively yield (relative_path, (mtime, size, attrs)) under a directory.
 
-                    filename = file_path.name
+        Relative paths are built from entry names with forward slashes as we descend,
+        so no per-entry relative_to() or separator replacement is needed. Ignored
+        directories and directory symlinks are not descended into, but are still
+        reported when empty.
 
-                    if self._should_ignore(filename):
-                        logger.debug(f"Ignoring file: {relative_path_str}")
+        Args:
+            dir_path: Filesystem path of the directory to list
+            rel_prefix: Relative path of dir_path with a trailing "/" ("" for the root)
+        """
+        has_entries = False
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                has_entries = True
+                # Interned: the left scan, right scan and loaded state then share one
+                # string per path, so key comparisons between them are identity checks
+                relative_path_str = sys.intern(rel_prefix + entry.name)
+
+                if entry.is_file():
+                    if self._should_ignore(entry.name):
+                        logger.debug("Ignoring file: %s", relative_path_str)
                         continue
 
                     try:
-                        stat_info = file_path.stat()
-                        attrs = self.get_file_attributes(file_path)
-                        result[relative_path_str] = (stat_info.st_mtime, stat_info.st_size, attrs)
+                        stat_info = entry.stat()
+                        attrs = self.get_file_attributes(entry.path)
                     except (OSError, IOError) as e:
-                        logger.warning(f"Could not stat file {relative_path_str}: {e}")
-                elif file_path.is_dir():
-                    # Track empty directories
-                    # Check if directory is empty (no files or subdirectories)
-                    if not any(file_path.iterdir()):
-                        # Use -1 as sentinel for directory size, 0 for attrs (don't track dir attrs)
+                        logger.warning("Could not stat file %s: %s", relative_path_str, e)
+                        continue
+                    yield relative_path_str, (stat_info.st_mtime, stat_info.st_size, attrs)
+                elif entry.is_dir():
+                    if self._should_ignore_directory(entry.name) or entry.is_symlink():
+                        logger.debug("Not descending into directory: %s", relative_path_str)
                         try:
-                            stat_info = file_path.stat()
-                            result[relative_path_str] = (stat_info.st_mtime, -1, 0)
-                            logger.debug(f"Found empty directory: {relative_path_str}")
+                            with os.scandir(entry.path) as children:
+                                is_empty = next(children, None) is None
                         except (OSError, IOError) as e:
-                            logger.warning(f"Could not stat directory {relative_path_str}: {e}")
-        except (OSError, IOError) as e:
-            logger.error(f"Error scanning directory {root_path}: {e}")
+                            logger.warning("Could not scan directory %s: %s", relative_path_str, e)
+                            continue
+                        if is_empty:
+                            info = self._empty_directory_info(entry.path, relative_path_str)
+                            if info is not None:
+                                yield relative_path_str, info
+                        continue
 
-        logger.info(f"Scanned {len(result)} items (files and empty directories) in {root_path}")
-        return result
+                    try:
+                        yield from self._walk(entry.path, relative_path_str + "/")
+                    except (OSError, IOError) as e:
+                        logger.warning("Could not scan directory %s: %s", relative_path_str, e)
+
+        # Track empty directories (no files or subdirectories at all)
+        if not has_entries and rel_prefix:
+            relative_path_str = sys.intern(rel_prefix[:-1])
+            info = self._empty_directory_info(dir_path, relative_path_str)
+            if info is not None:
+                yield relative_path_str, info
+
+    @staticmethod
+    def _empty_directory_info(
+        dir_path: str, relative_path_str: str
+    ) -> tuple[float, int, int] | None:
+        """Build the scan tuple for an empty directory, or None if it cannot be stat'ed."""
+        try:
+            stat_info = os.stat(dir_path)
+        except (OSError, IOError) as e:
+            logger.warning("Could not stat directory %s: %s", relative_path_str, e)
+            return None
+        logger.debug("Found empty directory: %s", relative_path_str)
+        # Use -1 as sentinel for directory size, 0 for attrs (don't track dir attrs)
+        return (stat_info.st_mtime, -1, 0)
 
     def merge_scans(
         self,
-        left_scan: Dict[str, tuple[float, int, int]],
-        right_scan: Dict[str, tuple[float, int, int]],
+        left_scan: Dict[str, tuple[float, int] | tuple[float, int, int]],
+        right_scan: Dict[str, tuple[float, int] | tuple[float, int, int]],
     ) -> Dict[str, FileMetadata]:
         """Merge left and right scans into unified metadata.
 
@@ -217,106 +303,59 @@ class Scanner:
         from whichever side has changed it most recently (based on database state when possible).
 
         Args:
-            left_scan: Results from scanning left directory (mtime, size, attrs tuples)
-            right_scan: Results from scanning right directory (mtime, size, attrs tuples)
+            left_scan: Results from scanning left directory (mtime, size, attrs tuples;
+                attrs may be omitted and defaults to 0)
+            right_scan: Results from scanning right directory (mtime, size, attrs tuples;
+                attrs may be omitted and defaults to 0)
 
         Returns:
             Dict mapping relative path to FileMetadata
         """
         result = {}
+        left_scan = _with_attrs(left_scan)
+        right_scan = _with_attrs(right_scan)
 
         # Build case-insensitive lookup for right scan
         right_lower_to_actual = {path.lower(): path for path in right_scan.keys()}
         processed_right = set()
 
-        # Process all left files
-        for left_path in left_scan.keys():
-            left_lower = left_path.lower()
+        # Process all left files, keeping left-scan order for the merged result
+        for left_path, left_info in left_scan.items():
+            # Find matching file on right - prefer exact case match first; a single
+            # get() both tests for and fetches it
+            right_actual_path = left_path
+            right_info = right_scan.get(left_path)
 
-            # Find matching file on right - prefer exact case match first
-            if left_path in right_scan:
-                # Exact case match exists
-                right_actual_path = left_path
-                right_exists = True
-            else:
+            if right_info is None:
                 # Check for case-insensitive match
-                potential_right = right_lower_to_actual.get(left_lower)
+                potential_right = right_lower_to_actual.get(left_path.lower())
 
                 # Only use case-insensitive match if no other left file has exact match with it
                 # This prevents matching left's "test.txt" to right's "Test.txt" when
                 # left also has "Test.txt" that should be the exact match
-                if potential_right and potential_right in left_scan:
-                    # Another left file has exact match with this right file, don't use it
-                    right_actual_path = None
-                    right_exists = False
-                else:
+                if potential_right is not None and potential_right not in left_scan:
                     right_actual_path = potential_right
-                    right_exists = potential_right is not None
-
-            if right_exists:
-                processed_right.add(right_actual_path)
-
-            # Determine canonical case: use left's case
-            canonical_path = left_path
+                    right_info = right_scan[potential_right]
 
             # Store with the canonical (left's) case
-            left_attrs = left_scan[left_path][2] if len(left_scan[left_path]) > 2 else None
-            right_attrs = (
-                right_scan[right_actual_path][2]
-                if right_exists and len(right_scan[right_actual_path]) > 2
-                else None
-            )
-            metadata = FileMetadata(
-                relative_path=canonical_path,
-                exists_left=True,
-                exists_right=right_exists,
-                mtime_left=left_scan[left_path][0],
-                size_left=left_scan[left_path][1],
-                attrs_left=left_attrs,
-                mtime_right=right_scan[right_actual_path][0] if right_exists else None,
-                size_right=right_scan[right_actual_path][1] if right_exists else None,
-                attrs_right=right_attrs,
-            )
-            result[canonical_path] = metadata
+            if right_info is None:
+                result[left_path] = _left_only(left_path, left_info)
+                continue
+
+            processed_right.add(right_actual_path)
+            result[left_path] = _both_sides(left_path, left_info, right_info)
 
             # If right has a different case, also create a separate entry for case change detection
             # This entry represents the file as it exists on right with its actual case
-            if right_exists and right_actual_path != left_path and right_actual_path not in result:
-                # Create metadata entry showing file exists on right with different case
-                right_attrs = (
-                    right_scan[right_actual_path][2]
-                    if len(right_scan[right_actual_path]) > 2
-                    else None
-                )
-                right_case_metadata = FileMetadata(
-                    relative_path=right_actual_path,
-                    exists_left=False,  # Not at this case on left
-                    exists_right=True,
-                    mtime_left=None,
-                    size_left=None,
-                    attrs_left=None,
-                    mtime_right=right_scan[right_actual_path][0],
-                    size_right=right_scan[right_actual_path][1],
-                    attrs_right=right_attrs,
-                )
-                result[right_actual_path] = right_case_metadata
+            if right_actual_path != left_path and right_actual_path not in result:
+                # Not at this case on left, so it is recorded as right-only
+                result[right_actual_path] = _right_only(right_actual_path, right_info)
 
         # Process right files that weren't matched
-        for right_path in right_scan.keys():
+        for right_path, right_info in right_scan.items():
             if right_path not in processed_right:
-                right_attrs = right_scan[right_path][2] if len(right_scan[right_path]) > 2 else None
-                metadata = FileMetadata(
-                    relative_path=right_path,  # Use right case since no left match
-                    exists_left=False,
-                    exists_right=True,
-                    mtime_left=None,
-                    size_left=None,
-                    attrs_left=None,
-                    mtime_right=right_scan[right_path][0],
-                    size_right=right_scan[right_path][1],
-                    attrs_right=right_attrs,
-                )
-                result[right_path] = metadata
-
-        logger.info(f"Merged scans: {len(result)} total unique files")
+                # Use right case since no left match
+                result[right_path] = _right_only(right_path, right_info)
+
+        logger.info("Merged scans: %s total unique files", len(result))
         return result
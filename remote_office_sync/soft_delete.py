@@ -109,7 +109,7 @@ class SoftDeleteManager:
                     if mtime < threshold:
                         file_path.unlink()
                         purged += 1
-                        logger.info(f"Purged old deleted file: {file_path}")
+                        logger.info("Purged old deleted file: %s", file_path)
 
             logger.info(f"Purged {purged} files older than {days_old} days")
         except (OSError, IOError) as e:
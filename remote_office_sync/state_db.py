@@ -1,6 +1,9 @@
 """State database for tracking sync history."""
 
 import sqlite3
+import sys
+import threading
+from operator import attrgetter
 from typing import Dict, Optional
 
 from remote_office_sync.logging_setup import get_logger
@@ -8,6 +11,103 @@ from remote_office_sync.scanner import FileMetadata
 
 logger = get_logger()
 
+# Applied to every connection: WAL + synchronous=NORMAL means one WAL append per
+# commit instead of a journal write plus fsyncs, and a 64 MB page cache lets the
+# full-table load/save fit in memory. mmap lets full-table reads use the OS page
+# cache directly instead of a read() per page.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+# Current files table schema. Older databases are brought up to it by the
+# _migrate_to_v* methods. WITHOUT ROWID clusters rows on path, so lookups by
+# path are a single B-tree search and no separate primary-key index is stored.
+_SQL_FILES_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        path TEXT PRIMARY KEY,
+        exists_left INTEGER,
+        exists_right INTEGER,
+        mtime_left REAL,
+        mtime_right REAL,
+        size_left INTEGER,
+        size_right INTEGER,
+        attrs_left INTEGER,
+        attrs_right INTEGER
+    ) WITHOUT ROWID
+"""
+_SQL_CREATE_FILES = _SQL_FILES_TABLE.format(name="files")
+
+# Statements used on the hot path, kept as module constants so each one maps to a
+# single entry in the connection's prepared-statement cache
+_SQL_COLUMNS = (
+    "path, exists_left, exists_right, mtime_left, mtime_right, "
+    "size_left, size_right, attrs_left, attrs_right"
+)
+_SQL_SELECT_ALL = f"SELECT {_SQL_COLUMNS} FROM files"
+_SQL_SELECT_ONE = f"SELECT {_SQL_COLUMNS} FROM files WHERE path = ?"
+_SQL_DELETE_ALL = "DELETE FROM files"
+_SQL_DELETE_ONE = "DELETE FROM files WHERE path = ?"
+_SQL_UPSERT = """
+    INSERT INTO files
+    (path, exists_left, exists_right, mtime_left,
+     mtime_right, size_left, size_right, attrs_left, attrs_right)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        exists_left = excluded.exists_left,
+        exists_right = excluded.exists_right,
+        mtime_left = excluded.mtime_left,
+        mtime_right = excluded.mtime_right,
+        size_left = excluded.size_left,
+        size_right = excluded.size_right,
+        attrs_left = excluded.attrs_left,
+        attrs_right = excluded.attrs_right
+"""
+
+
+# Converts FileMetadata to a files row in _SQL_COLUMNS order. attrgetter builds the
+# tuple in C, which matters because save_state builds one per tracked file to diff
+# against the snapshot. exists_* stay bool and are stored as INTEGER 0/1; bool is not an
+# exact int, so each one goes through sqlite3's adapter lookup when bound. That cost is
+# only paid for rows actually written, whereas int() here would run for every file.
+_metadata_row = attrgetter(
+    "relative_path",
+    "exists_left",
+    "exists_right",
+    "mtime_left",
+    "mtime_right",
+    "size_left",
+    "size_right",
+    "attrs_left",
+    "attrs_right",
+)
+
+
+def _row_to_metadata(cursor: sqlite3.Cursor, row: tuple) -> FileMetadata:
+    """Row factory building FileMetadata straight from a _SQL_COLUMNS row.
+
+    Paths are interned so the same path loaded again, or compared against a scanned
+    path, shares one string object and equality checks short-circuit on identity.
+    NULL columns (e.g. attrs in rows written before v2) load as the 0 sentinels
+    FileMetadata uses for missing values.
+    """
+    return FileMetadata(
+        sys.intern(row[0]),
+        bool(row[1]),
+        bool(row[2]),
+        row[3] or 0.0,
+        row[4] or 0.0,
+        row[5] or 0,
+        row[6] or 0,
+        row[7] or 0,
+        row[8] or 0,
+    )
+
 
 class StateDB:
     """SQLite database for tracking file sync state."""
@@ -19,12 +119,68 @@ class StateDB:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # One long-lived connection keeps the page cache and mmap window warm across
+        # calls; the lock serializes access since it may be shared between threads.
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+        # Rows as last read from or written to the files table, keyed by path. Lets
+        # save_state write only the difference. Assumes this instance is the only
+        # writer between load_state and save_state; None means unknown.
+        self._snapshot: Optional[Dict[str, tuple]] = None
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with performance PRAGMAs applied.
+
+        Returns:
+            Configured database connection
+        """
+        # isolation_level=None: the driver never opens transactions implicitly; every
+        # write path issues its own BEGIN, so transaction boundaries are explicit
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            detect_types=0,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the open connection, reconnecting if close() has been called.
+
+        Must be called with self._lock held. The schema was migrated by _init_db, so a
+        fresh connection needs no further setup.
+
+        Returns:
+            Open database connection
+        """
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection.
+
+        Safe to call more than once; later calls on this instance reopen it.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                # Refresh planner statistics if the table changed enough to matter;
+                # usually a no-op
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.debug("PRAGMA optimize failed: %s", e)
+            self._conn.close()
+            self._conn = None
+
     def _init_db(self) -> None:
         """Initialize database schema and run migrations."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._conn
+        with self._lock:
             # Create schema_version table if it doesn't exist
             conn.execute(
                 """
@@ -35,28 +191,14 @@ class StateDB:
                 """
             )
 
-            # Create files table if it doesn't exist (v1 schema)
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS files (
-                    path TEXT PRIMARY KEY,
-                    exists_left INTEGER,
-                    exists_right INTEGER,
-                    mtime_left REAL,
-                    mtime_right REAL,
-                    size_left INTEGER,
-                    size_right INTEGER
-                )
-                """
-            )
-            conn.commit()
+            # Create files table if it doesn't exist, already at the current schema so
+            # a new database needs no ALTER TABLE migrations
+            conn.execute(_SQL_CREATE_FILES)
 
             # Run any pending migrations
             self._migrate_schema(conn)
 
-            logger.info(f"Initialized state database at {self.db_path}")
-        finally:
-            conn.close()
+            logger.info("Initialized state database at %s", self.db_path)
 
     def _get_schema_version(self, conn: sqlite3.Connection) -> int:
         """Get current schema version.
@@ -101,11 +243,13 @@ class StateDB:
         """
         conn.execute("DELETE FROM schema_version")  # Keep only latest version
         conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
-        conn.commit()
 
     def _migrate_schema(self, conn: sqlite3.Connection) -> None:
         """Run all pending schema migrations.
 
+        Each migration runs in its own transaction together with its version bump,
+        so an interrupted migration leaves the previous schema intact.
+
         Args:
             conn: Database connection
         """
@@ -113,7 +257,15 @@ class StateDB:
 
         # Migrate to v2 if needed (add attribute columns)
         if current_version < 2:
-            self._migrate_to_v2(conn)
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._migrate_to_v2(conn)
+
+        # Migrate to v3 if needed (rebuild files as WITHOUT ROWID)
+        if current_version < 3:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._migrate_to_v3(conn)
 
     def _migrate_to_v2(self, conn: sqlite3.Connection) -> None:
         """Migrate schema to v2: Add attrs_left and attrs_right columns.
@@ -137,6 +289,32 @@ class StateDB:
         self._set_schema_version(conn, 2)
         logger.info("Migrated schema to v2")
 
+    def _migrate_to_v3(self, conn: sqlite3.Connection) -> None:
+        """Migrate schema to v3: Rebuild files as a WITHOUT ROWID table.
+
+        Args:
+            conn: Database connection
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'files'"
+        ).fetchone()
+
+        if row and "WITHOUT ROWID" not in row[0].upper():
+            conn.execute("DROP TABLE IF EXISTS files_v3")
+            conn.execute(_SQL_FILES_TABLE.format(name="files_v3"))
+            # A rowid table tolerates NULL primary keys; WITHOUT ROWID does not
+            conn.execute(
+                f"INSERT INTO files_v3 ({_SQL_COLUMNS}) "
+                f"SELECT {_SQL_COLUMNS} FROM files WHERE path IS NOT NULL"
+            )
+            conn.execute("DROP TABLE files")
+            conn.execute("ALTER TABLE files_v3 RENAME TO files")
+            logger.info("Rebuilt files table as WITHOUT ROWID")
+
+        # Record the migration
+        self._set_schema_version(conn, 3)
+        logger.info("Migrated schema to v3")
+
     def load_state(self) -> Dict[str, FileMetadata]:
         """Load previous state from database.
 
@@ -145,103 +323,64 @@ class StateDB:
         """
         result = {}
 
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            # Query all columns that exist
-            cursor = conn.execute("SELECT * FROM files")
-            for row in cursor.fetchall():
-                # Extract values based on column count
-                # Old schema has 7 columns, new has 9
-                if len(row) >= 9:
-                    (
-                        path,
-                        exists_left,
-                        exists_right,
-                        mtime_left,
-                        mtime_right,
-                        size_left,
-                        size_right,
-                        attrs_left,
-                        attrs_right,
-                    ) = row[:9]
-                else:
-                    (
-                        path,
-                        exists_left,
-                        exists_right,
-                        mtime_left,
-                        mtime_right,
-                        size_left,
-                        size_right,
-                    ) = row
-                    attrs_left = None
-                    attrs_right = None
-
-                metadata = FileMetadata(
-                    relative_path=path,
-                    exists_left=bool(exists_left),
-                    exists_right=bool(exists_right),
-                    mtime_left=mtime_left,
-                    mtime_right=mtime_right,
-                    size_left=size_left,
-                    size_right=size_right,
-                    attrs_left=attrs_left,
-                    attrs_right=attrs_right,
-                )
-                result[path] = metadata
-
-            logger.info(f"Loaded state for {len(result)} files from database")
-        except sqlite3.Error as e:
-            logger.warning(f"Error loading state from database: {e}")
-        finally:
-            if conn:
-                conn.close()
+        with self._lock:
+            try:
+                conn = self._connection()
+                # _init_db has migrated the table, so every column is present
+                cursor = conn.cursor()
+                cursor.row_factory = _row_to_metadata
+                # Iterate the cursor rather than fetchall() so rows stream into the
+                # dict without an intermediate list of every row
+                result = {m.relative_path: m for m in cursor.execute(_SQL_SELECT_ALL)}
+
+                self._snapshot = {path: _metadata_row(m) for path, m in result.items()}
+                logger.info("Loaded state for %s files from database", len(result))
+            except sqlite3.Error as e:
+                self._snapshot = None
+                logger.warning("Error loading state from database: %s", e)
 
         return result
 
     def save_state(self, state: Dict[str, FileMetadata]) -> None:
         """Save current state to database.
 
+        When the stored rows are known from a previous load_state/save_state, only
+        added, changed and removed rows are written; otherwise the table is rewritten.
+
         Args:
             state: Dict mapping relative path to FileMetadata
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("DELETE FROM files")
-
-            data = [
-                (
-                    metadata.relative_path,
-                    int(metadata.exists_left),
-                    int(metadata.exists_right),
-                    metadata.mtime_left,
-                    metadata.mtime_right,
-                    metadata.size_left,
-                    metadata.size_right,
-                    metadata.attrs_left,
-                    metadata.attrs_right,
+        with self._lock:
+            try:
+                conn = self._connection()
+                rows = {m.relative_path: _metadata_row(m) for m in state.values()}
+                snapshot = self._snapshot
+
+                # One write transaction: a single commit, and readers never observe a
+                # half-written table. The context manager commits on success and
+                # rolls back on error.
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    if snapshot is None:
+                        conn.execute(_SQL_DELETE_ALL)
+                        conn.executemany(_SQL_UPSERT, rows.values())
+                        written = len(rows)
+                    else:
+                        removed = [(path,) for path in snapshot if path not in rows]
+                        changed = [row for path, row in rows.items() if snapshot.get(path) != row]
+                        conn.executemany(_SQL_DELETE_ONE, removed)
+                        conn.executemany(_SQL_UPSERT, changed)
+                        written = len(removed) + len(changed)
+
+                self._snapshot = rows
+                logger.info(
+                    "Saved state for %s files to database (%s rows written)",
+                    len(state),
+                    written,
                 )
-                for metadata in state.values()
-            ]
-
-            sql = """
-                INSERT INTO files
-                (path, exists_left, exists_right, mtime_left,
-                 mtime_right, size_left, size_right, attrs_left, attrs_right)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-            conn.executemany(sql, data)
-            conn.commit()
-
-            logger.info(f"Saved state for {len(state)} files to database")
-        except sqlite3.Error as e:
-            logger.error(f"Error saving state to database: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
+            except sqlite3.Error as e:
+                logger.error("Error saving state to database: %s", e)
+                raise
 
     def get_file_state(self, path: str) -> Optional[FileMetadata]:
         """Get state for a specific file.
@@ -252,70 +391,31 @@ class StateDB:
         Returns:
             FileMetadata if found, None otherwise
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.execute("SELECT * FROM files WHERE path = ?", (path,))
-            row = cursor.fetchone()
-
-            if row:
-                # Extract values based on column count
-                # Old schema has 7 columns, new has 9
-                if len(row) >= 9:
-                    (
-                        path,
-                        exists_left,
-                        exists_right,
-                        mtime_left,
-                        mtime_right,
-                        size_left,
-                        size_right,
-                        attrs_left,
-                        attrs_right,
-                    ) = row[:9]
-                else:
-                    (
-                        path,
-                        exists_left,
-                        exists_right,
-                        mtime_left,
-                        mtime_right,
-                        size_left,
-                        size_right,
-                    ) = row
-                    attrs_left = None
-                    attrs_right = None
-
-                return FileMetadata(
-                    relative_path=path,
-                    exists_left=bool(exists_left),
-                    exists_right=bool(exists_right),
-                    mtime_left=mtime_left,
-                    mtime_right=mtime_right,
-                    size_left=size_left,
-                    size_right=size_right,
-                    attrs_left=attrs_left,
-                    attrs_right=attrs_right,
-                )
-        except sqlite3.Error as e:
-            logger.warning(f"Error getting file state: {e}")
-        finally:
-            if conn:
-                conn.close()
+        with self._lock:
+            try:
+                conn = self._connection()
+                cursor = conn.cursor()
+                cursor.row_factory = _row_to_metadata
+                return cursor.execute(_SQL_SELECT_ONE, (path,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Error getting file state: %s", e)
 
         return None
 
     def clear_state(self) -> None:
         """Clear all state from database."""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("DELETE FROM files")
-            conn.commit()
-            logger.info("Cleared all state from database")
-        except sqlite3.Error as e:
-            logger.error(f"Error clearing state: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
+        with self._lock:
+            try:
+                conn = self._connection()
+                # Dropping and recreating the table frees its pages in one step instead
+                # of walking the B-tree; the DDL is the current schema, so no
+                # migration is needed afterwards
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.execute("DROP TABLE IF EXISTS files")
+                    conn.execute(_SQL_CREATE_FILES)
+                self._snapshot = {}
+                logger.info("Cleared all state from database")
+            except sqlite3.Error as e:
+                logger.error("Error clearing state: %s", e)
+                raise
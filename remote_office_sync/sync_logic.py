@@ -1,9 +1,13 @@
 """Core sync decision engine."""
 
+import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum, auto
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 
 from remote_office_sync.config_loader import Config
 from remote_office_sync.conflict import ConflictDetector, ConflictResolution, ConflictType
@@ -13,31 +17,101 @@ from remote_office_sync.scanner import FileMetadata
 logger = get_logger()
 
 
-class SyncAction(Enum):
-    """Sync actions to perform."""
-
-    COPY_LEFT_TO_RIGHT = "COPY_LEFT_TO_RIGHT"
-    COPY_RIGHT_TO_LEFT = "COPY_RIGHT_TO_LEFT"
-    DELETE_LEFT = "DELETE_LEFT"
-    DELETE_RIGHT = "DELETE_RIGHT"
-    SOFT_DELETE_LEFT = "SOFT_DELETE_LEFT"
-    SOFT_DELETE_RIGHT = "SOFT_DELETE_RIGHT"
-    CLASH_CREATE = "CLASH_CREATE"
-    CASE_CONFLICT = "CASE_CONFLICT"
-    DIR_CASE_CONFLICT = "DIR_CASE_CONFLICT"
-    RENAME_LEFT = "RENAME_LEFT"
-    RENAME_RIGHT = "RENAME_RIGHT"
-    RENAME_CONFLICT = "RENAME_CONFLICT"
-    CREATE_DIR_LEFT = "CREATE_DIR_LEFT"
-    CREATE_DIR_RIGHT = "CREATE_DIR_RIGHT"
-    DELETE_DIR_LEFT = "DELETE_DIR_LEFT"
-    DELETE_DIR_RIGHT = "DELETE_DIR_RIGHT"
-    SYNC_ATTRS_LEFT_TO_RIGHT = "SYNC_ATTRS_LEFT_TO_RIGHT"
-    SYNC_ATTRS_RIGHT_TO_LEFT = "SYNC_ATTRS_RIGHT_TO_LEFT"
-    NOOP = "NOOP"
-
-
-@dataclass
+class SyncAction(IntEnum):
+    """Sync actions to perform.
+
+    Integer-valued so comparisons and dict lookups on actions hash and compare as ints.
+    Use ``.name`` for a readable label.
+    """
+
+    COPY_LEFT_TO_RIGHT = auto()
+    COPY_RIGHT_TO_LEFT = auto()
+    DELETE_LEFT = auto()
+    DELETE_RIGHT = auto()
+    SOFT_DELETE_LEFT = auto()
+    SOFT_DELETE_RIGHT = auto()
+    CLASH_CREATE = auto()
+    CASE_CONFLICT = auto()
+    DIR_CASE_CONFLICT = auto()
+    RENAME_LEFT = auto()
+    RENAME_RIGHT = auto()
+    RENAME_CONFLICT = auto()
+    CREATE_DIR_LEFT = auto()
+    CREATE_DIR_RIGHT = auto()
+    DELETE_DIR_LEFT = auto()
+    DELETE_DIR_RIGHT = auto()
+    SYNC_ATTRS_LEFT_TO_RIGHT = auto()
+    SYNC_ATTRS_RIGHT_TO_LEFT = auto()
+    NOOP = auto()
+
+
+# Conflict policy names from config -> resolution
+_POLICY_MAP = {
+    "clash": ConflictResolution.CLASH,
+    "notify_only": ConflictResolution.NOTIFY_ONLY,
+    "overwrite_newer": ConflictResolution.OVERWRITE_NEWER,
+}
+
+# ConflictDetector.resolve_conflict() result -> (job action, details template).
+# Results not listed here (NOOP, None) produce no job.
+_CONFLICT_ACTIONS = {
+    "CLASH_CREATE": (SyncAction.CLASH_CREATE, "Conflict type: {}"),
+    "COPY_LEFT_TO_RIGHT": (
+        SyncAction.COPY_LEFT_TO_RIGHT,
+        "Resolved conflict ({}): newer on left",
+    ),
+    "COPY_RIGHT_TO_LEFT": (
+        SyncAction.COPY_RIGHT_TO_LEFT,
+        "Resolved conflict ({}): newer on right",
+    ),
+    "NOTIFY": (SyncAction.NOOP, "Conflict detected, notify only: {}"),
+}
+
+# Case-conflict snapshots are read in parallel once there are more than this many
+_SNAPSHOT_PREFETCH_MIN = 4
+_SNAPSHOT_PREFETCH_WORKERS = 8
+
+# File rules, keyed by (exists_left << 3) | (exists_right << 2) | state, where state is
+#   file on one side only: 0 = new, 1 = deleted on the other side and unchanged here,
+#                          2 = deleted on the other side but changed here, 3 = asymmetry
+#   file on both sides:    (changed_left << 1) | changed_right
+# Keys not listed here produce no job.
+_FILE_RULES = {
+    0b1000: (SyncAction.COPY_LEFT_TO_RIGHT, "New file on left"),
+    0b1001: (SyncAction.DELETE_LEFT, "Deleted on right (unchanged on left)"),
+    0b1010: (SyncAction.COPY_LEFT_TO_RIGHT, "Deleted on right but changed on left"),
+    0b1011: (SyncAction.COPY_LEFT_TO_RIGHT, "File exists only on left (asymmetry fix)"),
+    0b0100: (SyncAction.COPY_RIGHT_TO_LEFT, "New file on right"),
+    0b0101: (SyncAction.DELETE_RIGHT, "Deleted on left (unchanged on right)"),
+    0b0110: (SyncAction.COPY_RIGHT_TO_LEFT, "Deleted on left but changed on right"),
+    0b0111: (SyncAction.COPY_RIGHT_TO_LEFT, "File exists only on right (asymmetry fix)"),
+    0b1110: (SyncAction.COPY_LEFT_TO_RIGHT, "Changed only on left"),
+    0b1101: (SyncAction.COPY_RIGHT_TO_LEFT, "Changed only on right"),
+}
+
+# Delete rule action -> (soft-delete action, previous size of the side it was deleted from)
+_SOFT_DELETES = {
+    SyncAction.DELETE_LEFT: (SyncAction.SOFT_DELETE_LEFT, attrgetter("size_right")),
+    SyncAction.DELETE_RIGHT: (SyncAction.SOFT_DELETE_RIGHT, attrgetter("size_left")),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CaseConflictPayload:
+    """Captured state for a CASE_CONFLICT job.
+
+    mtimes and bytes are taken when the job is generated so the runner can pick the
+    newer variant and preserve the older one even if files change afterwards.
+    """
+
+    prev_path: str
+    left_mtime: Optional[float] = None
+    right_mtime: Optional[float] = None
+    left_bytes: Optional[bytes] = None
+    right_bytes: Optional[bytes] = None
+
+
+@dataclass(slots=True)
 class SyncJob:
     """A single sync action to perform."""
 
@@ -46,7 +120,7 @@ class SyncJob:
     src_path: Optional[str] = None
     dst_path: Optional[str] = None
     details: Optional[str] = None
-    payload: Optional[dict] = field(default=None, repr=False)
+    payload: Optional[Union[dict, CaseConflictPayload]] = field(default=None, repr=False)
 
 
 class SyncEngine:
@@ -68,6 +142,31 @@ class SyncEngine:
             mtime_tolerance: Tolerance in seconds for mtime comparison (default 2.0)
         """
         self.config = config
+        # Config properties are recomputed from the raw dict on every access, so the
+        # soft-delete settings are read once and folded into one threshold: deletes of
+        # files up to this size become soft deletes (-inf when soft delete is disabled,
+        # inf when it has no size limit).
+        if not config.soft_delete_enabled:
+            self._soft_delete_threshold = float("-inf")
+        elif config.soft_delete_max_size_bytes is None:
+            self._soft_delete_threshold = float("inf")
+        else:
+            self._soft_delete_threshold = config.soft_delete_max_size_bytes
+        # Policies are fixed for the engine's lifetime, so resolve each conflict type's
+        # configured string to its ConflictResolution up front
+        policies = {
+            ConflictType.MODIFY_MODIFY: config.conflict_policy_modify_modify,
+            ConflictType.NEW_NEW: config.conflict_policy_new_new,
+        }
+        default_policy = config.conflict_policy_metadata_conflict
+        self._conflict_resolutions: Dict[ConflictType, ConflictResolution] = {
+            conflict_type: _POLICY_MAP.get(
+                policies.get(conflict_type, default_policy), ConflictResolution.CLASH
+            )
+            for conflict_type in ConflictType
+        }
+        self._left_root = Path(config.left_root)
+        self._right_root = Path(config.right_root)
         self.previous_state = previous_state
         self.current_state = current_state
         self.mtime_tolerance = mtime_tolerance
@@ -79,8 +178,13 @@ class SyncEngine:
             right_root=config.right_root,
         )
         # Cache bytes for case-variant paths so we can preserve older content
-        # even if overwritten later
+        # even if overwritten later. Detection only records which file to read
+        # (_snapshot_sources); bytes are read when a case conflict job needs them.
         self.case_snapshot: Dict[str, Optional[bytes]] = {}
+        self._snapshot_sources: Dict[str, Path] = {}
+        # Previous/current state paths grouped by lowercase, built on first use
+        self._prev_by_lower: Optional[Dict[str, List[str]]] = None
+        self._curr_by_lower: Optional[Dict[str, List[str]]] = None
 
     def generate_sync_jobs(self) -> List[SyncJob]:
         """Generate list of sync jobs to perform.
@@ -88,26 +192,55 @@ class SyncEngine:
         Returns:
             List of SyncJob objects
         """
-        jobs = []
+        jobs = list(self.iter_sync_jobs())
+
+        # One summary line with per-action counts; per-job details stay at debug level
+        action_counts = Counter(job.action.name for job in jobs)
+        summary = ", ".join(f"{name}={count}" for name, count in action_counts.items())
+        logger.info("Generated %d sync jobs%s", len(jobs), f" ({summary})" if summary else "")
+        if logger.isEnabledFor(logging.DEBUG):
+            for job in jobs:
+                logger.debug(
+                    "Job: action=%s, file_path=%s, src_path=%s",
+                    job.action.name,
+                    job.file_path,
+                    job.src_path,
+                )
+        return jobs
+
+    def iter_sync_jobs(self) -> Iterator[SyncJob]:
+        """Yield sync jobs to perform, in the same order as generate_sync_jobs().
+
+        Jobs are produced as each detection stage runs, so consumers can start on
+        early jobs without holding the full list. Content checks (hashing, case
+        snapshots) read the trees while iterating, so executing jobs before the
+        generator is exhausted can change later decisions.
+
+        Yields:
+            SyncJob objects
+        """
         processed = set()
 
-        # Prime snapshot cache for any paths that had case variants previously.
-        # This is best-effort: grab bytes before scanning current state to avoid
-        # external overwrites.
-        for prev_path in self.previous_state.keys():
-            for other in self.previous_state.keys():
-                if prev_path != other and prev_path.lower() == other.lower():
-                    # We have at least two variants in previous state; snapshot both
-                    for variant in (prev_path, other):
-                        path_left = Path(self.config.left_root) / variant
-                        path_right = Path(self.config.right_root) / variant
-                        if path_left.exists():
-                            self.case_snapshot[variant] = self._safe_read_bytes(path_left)
-                        elif path_right.exists():
-                            self.case_snapshot[variant] = self._safe_read_bytes(path_right)
+        # Record snapshot sources for any paths that had case variants previously.
+        # This is best-effort: bytes are read while jobs are generated, before any
+        # job runs and overwrites them.
+        for variants in self._previous_by_lower().values():
+            if len(variants) < 2:
+                continue
+            # At least two variants in previous state; snapshot each of them
+            for variant in variants:
+                path_left = self._left_root / variant
+                path_right = self._right_root / variant
+                if path_left.exists():
+                    self._snapshot_sources[variant] = path_left
+                elif path_right.exists():
+                    self._snapshot_sources[variant] = path_right
 
         # First detect case-only changes and case conflicts
         case_changes, case_conflicts = self._detect_case_changes()
+        self._prefetch_case_snapshots(
+            [variant for variants in case_conflicts.values() for variant in variants]
+        )
 
         # Detect directory-level case conflicts
         dir_case_conflicts = self._detect_directory_case_conflicts()
@@ -115,79 +248,98 @@ class SyncEngine:
         # Handle directory case conflicts first
         for base_dir, (left_case, right_case) in dir_case_conflicts.items():
             # Mark all files in these directories as processed
-            for file_path in list(self.current_state.keys()):
-                if file_path.lower().startswith(base_dir.lower() + "/"):
-                    processed.add(file_path)
-            jobs.extend(self._handle_directory_case_conflict(base_dir, left_case, right_case))
+            dir_prefix = base_dir.lower() + "/"
+            for path_lower, variants in self._group_by_lower_case().items():
+                if path_lower.startswith(dir_prefix):
+                    processed.update(variants)
+            yield from self._handle_directory_case_conflict(base_dir, left_case, right_case)
 
         # Handle case conflicts (both sides changed case differently)
         for prev_path, (left_case, right_case) in case_conflicts.items():
-            processed.add(prev_path)
-            processed.add(left_case)
-            processed.add(right_case)
             # Also add lowercase version to catch any merged entries
-            processed.add(left_case.lower())
-            processed.add(right_case.lower())
-            logger.debug(
-                f"Added to processed: {prev_path}, {left_case}, {right_case}, "
-                f"{left_case.lower()}, {right_case.lower()}"
-            )
+            added = (prev_path, left_case, right_case, left_case.lower(), right_case.lower())
+            processed.update(added)
+            logger.debug("Added to processed: %s", ", ".join(added))
             # Treat as a rename conflict with different case changes
-            jobs.extend(self._handle_case_conflict(prev_path, left_case, right_case))
+            yield from self._handle_case_conflict(prev_path, left_case, right_case)
 
         # Handle simple case changes (only one side changed case)
         for curr_path, prev_path in case_changes.items():
-            processed.add(prev_path)
-            processed.add(curr_path)
-            jobs.extend(self._handle_case_change(prev_path, curr_path))
+            processed.update((prev_path, curr_path))
+            yield from self._handle_case_change(prev_path, curr_path)
+
+        # Entries only in the previous or only in the current state, in state order.
+        # Computed once and shared by rename detection and the deleted-directory pass.
+        previous_state = self.previous_state
+        current_state = self.current_state
+        disappeared_items = [
+            (path, meta) for path, meta in previous_state.items() if path not in current_state
+        ]
+        appeared_items = [
+            (path, meta) for path, meta in current_state.items() if path not in previous_state
+        ]
 
         # Then detect renames (including case changes and conflicts)
-        rename_map, rename_conflicts = self._detect_renames()
+        rename_map, rename_conflicts = self._detect_renames(disappeared_items, appeared_items)
 
         # Handle rename conflicts
         for old_path, (left_new, right_new) in rename_conflicts.items():
             if old_path in processed or left_new in processed or right_new in processed:
                 continue
-            processed.add(old_path)
-            processed.add(left_new)
-            processed.add(right_new)
-            jobs.extend(self._handle_rename_conflict(old_path, left_new, right_new))
+            processed.update((old_path, left_new, right_new))
+            yield from self._handle_rename_conflict(old_path, left_new, right_new)
 
         # Handle clean renames
         for old_path, new_path in rename_map.items():
             if old_path in processed or new_path in processed:
                 continue
-            processed.add(old_path)
-            processed.add(new_path)
-            jobs.extend(self._handle_rename(old_path, new_path))
+            processed.update((old_path, new_path))
+            yield from self._handle_rename(old_path, new_path)
 
         # Then handle conflicts
-        conflicts = self.conflict_detector.detect_conflicts()
-        for file_path, (conflict_type, _, curr_metadata) in conflicts.items():
+        # Each path is yielded once, so processed can be extended after the loop
+        conflict_paths = []
+        for file_path, conflict_type, _, curr_metadata in self.conflict_detector.iter_conflicts():
             if file_path in processed:
-                logger.debug(f"Skipping {file_path} (already processed)")
+                logger.debug("Skipping %s (already processed)", file_path)
                 continue
-            processed.add(file_path)
-            jobs.extend(self._handle_conflict(file_path, conflict_type, curr_metadata))
-
-        # Then handle regular sync rules for current files
-        for file_path, curr_metadata in self.current_state.items():
+            conflict_paths.append(file_path)
+            yield from self._handle_conflict(file_path, conflict_type, curr_metadata)
+        processed.update(conflict_paths)
+
+        # Then handle regular sync rules for current files. Attribute-only changes are
+        # detected in the same pass but emitted after the deleted-directory jobs, so
+        # job order is unchanged.
+        # Bound once: this loop runs for every file in the scan
+        attribute_jobs = []
+        get_previous = previous_state.get
+        apply_sync_rules = self._apply_sync_rules
+        detect_attribute_change = self._detect_attribute_change
+        add_attribute_job = attribute_jobs.append
+        # processed is complete at this point; lowercase it once for the per-file check
+        processed_lower = {path.lower() for path in processed}
+        for file_path, curr_metadata in current_state.items():
             if file_path in processed:
-                logger.debug(f"Skipping {file_path} (already processed)")
+                logger.debug("Skipping %s (already processed)", file_path)
                 continue
 
+            prev_metadata = get_previous(file_path)
+
             # Debug: Check if lowercase version is in processed
-            if file_path.lower() in [p.lower() for p in processed]:
-                logger.debug(f"Skipping {file_path} (case-insensitive match in processed)")
-                continue
+            if file_path.lower() in processed_lower:
+                logger.debug("Skipping %s (case-insensitive match in processed)", file_path)
+            else:
+                logger.debug("Applying sync rules for %s (not in processed)", file_path)
+                yield from apply_sync_rules(file_path, prev_metadata, curr_metadata)
 
-            prev_metadata = self.previous_state.get(file_path)
-            logger.debug(f"Applying sync rules for {file_path} (not in processed)")
-            jobs.extend(self._apply_sync_rules(file_path, prev_metadata, curr_metadata))
+            if prev_metadata is not None:
+                attribute_job = detect_attribute_change(file_path, prev_metadata, curr_metadata)
+                if attribute_job is not None:
+                    add_attribute_job(attribute_job)
 
         # Handle deleted files and directories (existed in previous state but not current)
-        for file_path, prev_metadata in self.previous_state.items():
-            if file_path in processed or file_path in self.current_state:
+        for file_path, prev_metadata in disappeared_items:
+            if file_path in processed:
                 continue
 
             # Check if this was a directory
@@ -195,135 +347,118 @@ class SyncEngine:
                 # Directory was deleted - remove from other side
                 if prev_metadata.exists_left and not prev_metadata.exists_right:
                     # Was only on left, now gone -> delete from left
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.DELETE_DIR_LEFT,
-                            file_path=file_path,
-                            details="Empty directory deleted",
-                        )
+                    yield SyncJob(
+                        action=SyncAction.DELETE_DIR_LEFT,
+                        file_path=file_path,
+                        details="Empty directory deleted",
                     )
                 elif prev_metadata.exists_right and not prev_metadata.exists_left:
                     # Was only on right, now gone -> delete from right
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.DELETE_DIR_RIGHT,
-                            file_path=file_path,
-                            details="Empty directory deleted",
-                        )
+                    yield SyncJob(
+                        action=SyncAction.DELETE_DIR_RIGHT,
+                        file_path=file_path,
+                        details="Empty directory deleted",
                     )
                 elif prev_metadata.exists_left and prev_metadata.exists_right:
                     # Was on both sides, now gone -> delete from both
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.DELETE_DIR_LEFT,
-                            file_path=file_path,
-                            details="Empty directory deleted from both sides",
-                        )
+                    yield SyncJob(
+                        action=SyncAction.DELETE_DIR_LEFT,
+                        file_path=file_path,
+                        details="Empty directory deleted from both sides",
                     )
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.DELETE_DIR_RIGHT,
-                            file_path=file_path,
-                            details="Empty directory deleted from both sides",
-                        )
+                    yield SyncJob(
+                        action=SyncAction.DELETE_DIR_RIGHT,
+                        file_path=file_path,
+                        details="Empty directory deleted from both sides",
                     )
 
-        # Detect and handle attribute-only changes
-        for file_path, curr_metadata in self.current_state.items():
-            if file_path in processed:
-                continue
+        # Attribute-only changes found during the rules pass
+        yield from attribute_jobs
 
-            # Skip directories (don't track attributes for dirs)
-            if curr_metadata.is_directory():
-                continue
+    def _detect_attribute_change(
+        self, file_path: str, prev_metadata: FileMetadata, curr_metadata: FileMetadata
+    ) -> Optional[SyncJob]:
+        """Detect an attribute-only change on a file that exists on both sides.
 
-            # File exists on both sides
-            if not (curr_metadata.exists_left and curr_metadata.exists_right):
-                continue
+        Args:
+            file_path: File path
+            prev_metadata: Previous state
+            curr_metadata: Current state
 
-            prev_metadata = self.previous_state.get(file_path)
-            if not prev_metadata:
-                continue
+        Returns:
+            Attribute sync job, or None if there is nothing to sync
+        """
+        # Skip directories (don't track attributes for dirs)
+        if curr_metadata.is_directory():
+            return None
 
-            # Check if content is unchanged (same mtime and size)
-            left_unchanged = (
-                prev_metadata.mtime_left == curr_metadata.mtime_left
-                and prev_metadata.size_left == curr_metadata.size_left
-            )
-            right_unchanged = (
-                prev_metadata.mtime_right == curr_metadata.mtime_right
-                and prev_metadata.size_right == curr_metadata.size_right
-            )
+        # File exists on both sides
+        if not (curr_metadata.exists_left and curr_metadata.exists_right):
+            return None
 
-            if not (left_unchanged and right_unchanged):
-                continue
+        # Check if content is unchanged (same mtime and size)
+        left_unchanged = (
+            prev_metadata.mtime_left == curr_metadata.mtime_left
+            and prev_metadata.size_left == curr_metadata.size_left
+        )
+        right_unchanged = (
+            prev_metadata.mtime_right == curr_metadata.mtime_right
+            and prev_metadata.size_right == curr_metadata.size_right
+        )
 
-            # Content is unchanged - check for attribute changes
-            left_attrs = curr_metadata.attrs_left or 0
-            right_attrs = curr_metadata.attrs_right or 0
+        if not (left_unchanged and right_unchanged):
+            return None
 
-            if left_attrs == right_attrs:
-                continue
+        # Content is unchanged - check for attribute changes
+        left_attrs = curr_metadata.attrs_left
+        right_attrs = curr_metadata.attrs_right
 
-            # Attributes differ - determine which side changed
-            prev_left_attrs = prev_metadata.attrs_left or 0
-            prev_right_attrs = prev_metadata.attrs_right or 0
+        if left_attrs == right_attrs:
+            return None
 
-            if prev_left_attrs != left_attrs:
-                # Left side changed attributes
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.SYNC_ATTRS_LEFT_TO_RIGHT,
-                        file_path=file_path,
-                        payload={"attrs": left_attrs},
-                    )
-                )
-                processed.add(file_path)
-            elif prev_right_attrs != right_attrs:
-                # Right side changed attributes
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.SYNC_ATTRS_RIGHT_TO_LEFT,
-                        file_path=file_path,
-                        payload={"attrs": right_attrs},
-                    )
-                )
-                processed.add(file_path)
-            else:
-                # Both sides have attributes but they differ - use newer mtime
-                if curr_metadata.mtime_left > curr_metadata.mtime_right:
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.SYNC_ATTRS_LEFT_TO_RIGHT,
-                            file_path=file_path,
-                            payload={"attrs": left_attrs},
-                        )
-                    )
-                else:
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.SYNC_ATTRS_RIGHT_TO_LEFT,
-                            file_path=file_path,
-                            payload={"attrs": right_attrs},
-                        )
-                    )
-                processed.add(file_path)
+        # Attributes differ - determine which side changed
+        prev_left_attrs = prev_metadata.attrs_left
+        prev_right_attrs = prev_metadata.attrs_right
 
-        logger.info(f"Generated {len(jobs)} sync jobs")
-        for job in jobs:
-            logger.debug(
-                f"Job: action={job.action.value}, file_path={job.file_path}, "
-                f"src_path={job.src_path}"
+        if prev_left_attrs != left_attrs:
+            # Left side changed attributes
+            left_to_right = True
+        elif prev_right_attrs != right_attrs:
+            # Right side changed attributes
+            left_to_right = False
+        else:
+            # Both sides have attributes but they differ - use newer mtime
+            left_to_right = curr_metadata.mtime_left > curr_metadata.mtime_right
+
+        if left_to_right:
+            return SyncJob(
+                action=SyncAction.SYNC_ATTRS_LEFT_TO_RIGHT,
+                file_path=file_path,
+                payload={"attrs": left_attrs},
             )
-        return jobs
+        return SyncJob(
+            action=SyncAction.SYNC_ATTRS_RIGHT_TO_LEFT,
+            file_path=file_path,
+            payload={"attrs": right_attrs},
+        )
 
-    def _detect_renames(self) -> tuple[Dict[str, str], Dict[str, tuple[str, str]]]:
+    def _detect_renames(
+        self,
+        disappeared_items: Optional[List[tuple[str, FileMetadata]]] = None,
+        appeared_items: Optional[List[tuple[str, FileMetadata]]] = None,
+    ) -> tuple[Dict[str, str], Dict[str, tuple[str, str]]]:
         """Detect file and directory renames by matching size and mtime.
 
         For files: Matches within same side (side, mtime, size).
         For directories: Can match ACROSS sides because directories only have size=-1
                         and may have same mtime on both sides even after rename.
 
+        Args:
+            disappeared_items: (path, metadata) pairs only in previous state; computed
+                if not given
+            appeared_items: (path, metadata) pairs only in current state; computed
+                if not given
+
         Returns:
             Tuple of (rename_map, rename_conflicts) where:
             - rename_map: old_path -> new_path for clean renames
@@ -333,45 +468,56 @@ class SyncEngine:
         rename_conflicts = {}
 
         # Track renames by original path to detect conflicts
-        renames_by_original = {}
-
-        # Find files that disappeared from previous state
-        disappeared = {}
-        for prev_path, prev_meta in self.previous_state.items():
-            if prev_path not in self.current_state:
-                # File disappeared - store by (side, mtime, size) for matching
-                if prev_meta.exists_left:
-                    key = ("left", prev_meta.mtime_left, prev_meta.size_left)
-                    disappeared.setdefault(key, []).append((prev_path, prev_meta))
-                if prev_meta.exists_right:
-                    key = ("right", prev_meta.mtime_right, prev_meta.size_right)
-                    disappeared.setdefault(key, []).append((prev_path, prev_meta))
-
-        # Find files that appeared in current state
-        appeared = {}
-        for curr_path, curr_meta in self.current_state.items():
-            if curr_path not in self.previous_state:
-                # File appeared - check if it matches a disappeared file
-                if curr_meta.exists_left:
-                    key = ("left", curr_meta.mtime_left, curr_meta.size_left)
-                    appeared.setdefault(key, []).append((curr_path, curr_meta))
-                if curr_meta.exists_right:
-                    key = ("right", curr_meta.mtime_right, curr_meta.size_right)
-                    appeared.setdefault(key, []).append((curr_path, curr_meta))
-
-        # Match disappeared and appeared files (same-side matching)
+        renames_by_original = defaultdict(list)
+
+        if disappeared_items is None:
+            disappeared_items = [
+                (path, meta)
+                for path, meta in self.previous_state.items()
+                if path not in self.current_state
+            ]
+        if appeared_items is None:
+            appeared_items = [
+                (path, meta)
+                for path, meta in self.current_state.items()
+                if path not in self.previous_state
+            ]
+
+        # A rename pairs a disappeared entry with an appeared one; with either side
+        # empty (the usual incremental run) there is nothing to index
+        if not disappeared_items or not appeared_items:
+            return rename_map, rename_conflicts
+
+        # Index files that disappeared from previous state by (side, mtime, size)
+        disappeared = defaultdict(list)
+        for prev_path, prev_meta in disappeared_items:
+            if prev_meta.exists_left:
+                key = ("left", prev_meta.mtime_left, prev_meta.size_left)
+                disappeared[key].append((prev_path, prev_meta))
+            if prev_meta.exists_right:
+                key = ("right", prev_meta.mtime_right, prev_meta.size_right)
+                disappeared[key].append((prev_path, prev_meta))
+
+        # Index files that appeared in current state the same way
+        appeared = defaultdict(list)
+        for curr_path, curr_meta in appeared_items:
+            if curr_meta.exists_left:
+                key = ("left", curr_meta.mtime_left, curr_meta.size_left)
+                appeared[key].append((curr_path, curr_meta))
+            if curr_meta.exists_right:
+                key = ("right", curr_meta.mtime_right, curr_meta.size_right)
+                appeared[key].append((curr_path, curr_meta))
+
+        # Match disappeared and appeared files (same-side matching) with one probe per key
         for key, appeared_list in appeared.items():
-            if key in disappeared:
-                disappeared_list = disappeared[key]
-                # Simple 1:1 matching - if exactly one disappeared and one appeared
-                if len(appeared_list) == 1 and len(disappeared_list) == 1:
-                    old_path = disappeared_list[0][0]
-                    new_path = appeared_list[0][0]
-
-                    # Track this rename by original path
-                    if old_path not in renames_by_original:
-                        renames_by_original[old_path] = []
-                    renames_by_original[old_path].append((key[0], new_path))  # (side, new_path)
+            disappeared_list = disappeared.get(key)
+            # Simple 1:1 matching - if exactly one disappeared and one appeared
+            if disappeared_list and len(appeared_list) == 1 and len(disappeared_list) == 1:
+                old_path = disappeared_list[0][0]
+                new_path = appeared_list[0][0]
+
+                # Track this rename by original path as (side, new_path)
+                renames_by_original[old_path].append((key[0], new_path))
 
         # NEW: Cross-side directory rename detection
         # When a directory is renamed on one side only, it creates:
@@ -429,13 +575,13 @@ class SyncEngine:
                     old_path = left_disappeared_list[0][0]
                     new_path = right_appeared_list[0][0]
 
-                    logger.info(
-                        f"Detected directory rename on left: "
-                        f"{old_path} -> {new_path} (rename detected across sides)"
+                    logger.debug(
+                        "Detected directory rename on left: %s -> %s "
+                        "(rename detected across sides)",
+                        old_path,
+                        new_path,
                     )
 
-                    if old_path not in renames_by_original:
-                        renames_by_original[old_path] = []
                     renames_by_original[old_path].append(("left", new_path))
 
         # Case 2: Old name disappeared from right, new name appeared on left
@@ -459,39 +605,36 @@ class SyncEngine:
                     old_path = right_disappeared_list[0][0]
                     new_path = left_appeared_list[0][0]
 
-                    logger.info(
-                        f"Detected directory rename on right: "
-                        f"{old_path} -> {new_path} (rename detected across sides)"
+                    logger.debug(
+                        "Detected directory rename on right: %s -> %s "
+                        "(rename detected across sides)",
+                        old_path,
+                        new_path,
                     )
 
-                    if old_path not in renames_by_original:
-                        renames_by_original[old_path] = []
                     renames_by_original[old_path].append(("right", new_path))
 
         # Check for rename conflicts (same file renamed differently on both sides)
         for old_path, renames in renames_by_original.items():
             if len(renames) == 2:
-                # Renamed on both sides
-                left_rename = next((r for r in renames if r[0] == "left"), None)
-                right_rename = next((r for r in renames if r[0] == "right"), None)
-
-                if left_rename and right_rename:
-                    left_new = left_rename[1]
-                    right_new = right_rename[1]
-
-                    # Check if renamed to different names (case-sensitive comparison)
-                    if left_new != right_new:
-                        logger.warning(
-                            f"Rename conflict detected: {old_path} renamed to "
-                            f"{left_new} on left and {right_new} on right"
-                        )
-                        rename_conflicts[old_path] = (left_new, right_new)
-                        continue
+                # Renamed on both sides to different names (case-sensitive comparison)
+                new_by_side = dict(renames)
+                left_new = new_by_side.get("left")
+                right_new = new_by_side.get("right")
+                if left_new and right_new and left_new != right_new:
+                    logger.warning(
+                        "Rename conflict detected: %s renamed to %s on left and %s on right",
+                        old_path,
+                        left_new,
+                        right_new,
+                    )
+                    rename_conflicts[old_path] = (left_new, right_new)
+                    continue
 
             # No conflict - add single rename
             for side, new_path in renames:
                 rename_map[old_path] = new_path
-                logger.info(f"Detected rename on {side}: {old_path} -> {new_path}")
+                logger.debug("Detected rename on %s: %s -> %s", side, old_path, new_path)
 
         return rename_map, rename_conflicts
 
@@ -512,6 +655,7 @@ class SyncEngine:
 
         # Group current state by lowercase to identify case variants
         variants_by_lower = self._group_by_lower_case()
+        previous_by_lower = self._previous_by_lower()
 
         # Detect case conflicts first: same file with different cases on both sides
         # This happens when both left and right changed case to different values,
@@ -524,7 +668,7 @@ class SyncEngine:
                 meta_left = self.current_state[left_var]
                 meta_right = self.current_state[right_var]
 
-                # Snapshot bytes now to avoid later overwrites (best-effort)
+                # Record snapshot sources to avoid later overwrites (best-effort)
                 # On case-insensitive filesystems, we must check metadata to determine
                 # which side the file exists on, not just path.exists()
                 for var in variants:
@@ -532,23 +676,18 @@ class SyncEngine:
                     if not var_meta:
                         continue
 
-                    path_left = Path(self.config.left_root) / var
-                    path_right = Path(self.config.right_root) / var
+                    path_left = self._left_root / var
+                    path_right = self._right_root / var
 
                     # Use metadata to determine which side to read from
                     if var_meta.exists_left and path_left.exists():
-                        bytes_content = self._safe_read_bytes(path_left)
-                        self.case_snapshot[var] = bytes_content
+                        self._snapshot_sources[var] = path_left
                     elif var_meta.exists_right and path_right.exists():
-                        bytes_content = self._safe_read_bytes(path_right)
-                        self.case_snapshot[var] = bytes_content
+                        self._snapshot_sources[var] = path_right
 
-                # Find previous state entry (case-insensitive)
-                prev_path = None
-                for p in self.previous_state.keys():
-                    if p.lower() == path_lower:
-                        prev_path = p
-                        break
+                # Find previous state entry (case-insensitive, first in state order)
+                prev_variants = previous_by_lower.get(path_lower)
+                prev_path = prev_variants[0] if prev_variants else None
 
                 if prev_path is None:
                     # No previous state: new file with different cases on each side.
@@ -557,8 +696,9 @@ class SyncEngine:
                     processed.add(left_var)
                     processed.add(right_var)
                     logger.warning(
-                        f"Case conflict detected (new files): "
-                        f"{left_var} (left) vs {right_var} (right)"
+                        "Case conflict detected (new files): %s (left) vs %s (right)",
+                        left_var,
+                        right_var,
                     )
                     # Add directly to conflicts with left_var as the anchor
                     case_conflicts[left_var] = (left_var, right_var)
@@ -574,8 +714,10 @@ class SyncEngine:
                     processed.add(left_var)
                     processed.add(right_var)
                     logger.warning(
-                        f"Case conflict detected: {prev_path} -> "
-                        f"{left_var} (left) vs {right_var} (right)"
+                        "Case conflict detected: %s -> %s (left) vs %s (right)",
+                        prev_path,
+                        left_var,
+                        right_var,
                     )
                     case_conflicts[prev_path] = (left_var, right_var)
 
@@ -586,8 +728,10 @@ class SyncEngine:
                     processed.add(left_var)
                     processed.add(right_var)
                     logger.warning(
-                        f"Case conflict detected: {prev_path} -> "
-                        f"{left_var} (left) vs {right_var} (right, unchanged)"
+                        "Case conflict detected: %s -> %s (left) vs %s (right, unchanged)",
+                        prev_path,
+                        left_var,
+                        right_var,
                     )
                     # Store as (left_case, right_case) for conflict handling
                     case_conflicts[prev_path] = (left_var, right_var)
@@ -599,8 +743,10 @@ class SyncEngine:
                     processed.add(left_var)
                     processed.add(right_var)
                     logger.warning(
-                        f"Case conflict detected: {prev_path} -> "
-                        f"{left_var} (left, unchanged) vs {right_var} (right)"
+                        "Case conflict detected: %s -> %s (left, unchanged) vs %s (right)",
+                        prev_path,
+                        left_var,
+                        right_var,
                     )
                     # Store as (left_case, right_case) for conflict handling
                     case_conflicts[prev_path] = (left_var, right_var)
@@ -617,18 +763,20 @@ class SyncEngine:
                 # Exact match exists - no case change for this path
                 continue
 
-            # Look for case-insensitive match in previous state
-            curr_lower = curr_path.lower()
-            for prev_path, prev_meta in self.previous_state.items():
-                if prev_path.lower() == curr_lower and prev_path != curr_path:
-                    if prev_path not in processed:
-                        processed.add(prev_path)
-                        processed.add(curr_path)
-                        logger.info(
-                            f"Detected case change in canonical path: {prev_path} -> {curr_path}"
-                        )
-                        case_changes[curr_path] = prev_path
-                    break
+            # Look for case-insensitive match in previous state. curr_path itself is not
+            # in the previous state, so every variant found differs from it.
+            prev_variants = previous_by_lower.get(curr_path.lower())
+            if prev_variants:
+                prev_path = prev_variants[0]
+                if prev_path not in processed:
+                    processed.add(prev_path)
+                    processed.add(curr_path)
+                    logger.info(
+                        "Detected case change in canonical path: %s -> %s",
+                        prev_path,
+                        curr_path,
+                    )
+                    case_changes[curr_path] = prev_path
 
         return case_changes, case_conflicts
 
@@ -671,34 +819,86 @@ class SyncEngine:
                 if right_dir.lower() == left_lower and left_dir != right_dir:
                     # Found case mismatch
                     logger.warning(
-                        f"Directory case conflict detected: "
-                        f"{left_dir} (left) vs {right_dir} (right)"
+                        "Directory case conflict detected: %s (left) vs %s (right)",
+                        left_dir,
+                        right_dir,
                     )
                     dir_conflicts[left_lower] = (left_dir, right_dir)
                     break
 
         return dir_conflicts
 
+    def _previous_by_lower(self) -> Dict[str, List[str]]:
+        """Group previous state paths by lowercase variant, computing it once.
+
+        Returns:
+            Dict mapping lowercase path -> list of actual case variants, in state order
+        """
+        if self._prev_by_lower is None:
+            grouped = defaultdict(list)
+            for path in self.previous_state:
+                grouped[path.lower()].append(path)
+            self._prev_by_lower = dict(grouped)
+        return self._prev_by_lower
+
     def _group_by_lower_case(self) -> Dict[str, list]:
-        """Group current state paths by lowercase variant.
+        """Group current state paths by lowercase variant, computing it once.
 
         Returns:
             Dict mapping lowercase path -> list of actual case variants
         """
-        grouped = {}
-        for path in self.current_state.keys():
-            lower = path.lower()
-            if lower not in grouped:
-                grouped[lower] = []
-            grouped[lower].append(path)
-        return grouped
+        if self._curr_by_lower is None:
+            grouped = defaultdict(list)
+            for path in self.current_state:
+                grouped[path.lower()].append(path)
+            self._curr_by_lower = dict(grouped)
+        return self._curr_by_lower
+
+    def _case_snapshot(self, path: str) -> Optional[bytes]:
+        """Return snapshot bytes for a case variant, reading its source on first use.
+
+        Args:
+            path: Case variant path
+
+        Returns:
+            File bytes, or None if no source was recorded or the read failed
+        """
+        if path not in self.case_snapshot:
+            source = self._snapshot_sources.get(path)
+            if source is None:
+                return None
+            self.case_snapshot[path] = self._safe_read_bytes(source)
+        return self.case_snapshot[path]
+
+    def _prefetch_case_snapshots(self, paths: List[str]) -> None:
+        """Read snapshot bytes for many case variants concurrently.
+
+        On network shares each read is dominated by round-trip latency, so
+        overlapping them shortens generation when there are many case conflicts.
+        Small batches are left to the on-demand reads in _case_snapshot().
+
+        Args:
+            paths: Case variant paths whose snapshots will be needed
+        """
+        pending = {
+            path: self._snapshot_sources[path]
+            for path in paths
+            if path in self._snapshot_sources and path not in self.case_snapshot
+        }
+        if len(pending) <= _SNAPSHOT_PREFETCH_MIN:
+            return
+
+        workers = min(_SNAPSHOT_PREFETCH_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            contents = pool.map(self._safe_read_bytes, pending.values())
+            self.case_snapshot.update(zip(pending, contents))
 
     def _safe_read_bytes(self, path: Path) -> Optional[bytes]:
         """Best-effort read of file bytes for snapshotting older content."""
         try:
             return path.read_bytes()
         except (OSError, IOError) as exc:
-            logger.warning(f"Unable to read snapshot for {path}: {exc}")
+            logger.warning("Unable to read snapshot for %s: %s", path, exc)
             return None
 
     def _handle_case_change(self, prev_path: str, curr_path: str) -> List[SyncJob]:
@@ -775,24 +975,35 @@ class SyncEngine:
         jobs = []
 
         logger.warning(
-            f"Handling case conflict: {prev_path} -> " f"{left_case} (left) vs {right_case} (right)"
+            "Handling case conflict: %s -> %s (left) vs %s (right)",
+            prev_path,
+            left_case,
+            right_case,
         )
 
-        left_path = Path(self.config.left_root) / left_case
-        right_path = Path(self.config.right_root) / right_case
+        left_path = self._left_root / left_case
+        right_path = self._right_root / right_case
 
         left_meta = self.current_state.get(left_case)
         right_meta = self.current_state.get(right_case)
+        # Take each variant's mtime from a side it exists on (its own side first); None
+        # when it exists on neither, so the runner falls back to stat() at run time
         left_mtime = None
         right_mtime = None
         if left_meta:
-            left_mtime = left_meta.mtime_left or left_meta.mtime_right
+            if left_meta.exists_left:
+                left_mtime = left_meta.mtime_left
+            elif left_meta.exists_right:
+                left_mtime = left_meta.mtime_right
         if right_meta:
-            right_mtime = right_meta.mtime_right or right_meta.mtime_left
+            if right_meta.exists_right:
+                right_mtime = right_meta.mtime_right
+            elif right_meta.exists_left:
+                right_mtime = right_meta.mtime_left
 
         # Prefer pre-snapshotted bytes to avoid later overwrites
-        left_bytes_snapshot = self.case_snapshot.get(left_case)
-        right_bytes_snapshot = self.case_snapshot.get(right_case)
+        left_bytes_snapshot = self._case_snapshot(left_case)
+        right_bytes_snapshot = self._case_snapshot(right_case)
 
         # Create a CASE_CONFLICT job that will:
         # 1. Compare mtime of left_case vs right_case files
@@ -803,23 +1014,23 @@ class SyncEngine:
             file_path=left_case,  # Left case (canonical path)
             src_path=right_case,  # Right case (variant path)
             details=f"Case conflict: {left_case} (left) vs {right_case} (right)",
-            payload={
-                "prev_path": prev_path,
-                "left_mtime": left_mtime,
-                "right_mtime": right_mtime,
-                "left_bytes": (
+            payload=CaseConflictPayload(
+                prev_path=prev_path,
+                left_mtime=left_mtime,
+                right_mtime=right_mtime,
+                left_bytes=(
                     left_bytes_snapshot
                     if left_bytes_snapshot is not None
                     else self._safe_read_bytes(left_path)
                 ),
-                "right_bytes": (
+                right_bytes=(
                     right_bytes_snapshot
                     if right_bytes_snapshot is not None
                     else self._safe_read_bytes(right_path)
                 ),
-            },
+            ),
         )
-        logger.debug(f"Creating CASE_CONFLICT job: {job}")
+        logger.debug("Creating CASE_CONFLICT job: %s", job)
         jobs.append(job)
 
         return jobs
@@ -840,7 +1051,11 @@ class SyncEngine:
         Returns:
             List of sync jobs (DIR_CASE_CONFLICT action)
         """
-        logger.info(f"Handling directory case conflict: {left_case} (left) vs {right_case} (right)")
+        logger.info(
+            "Handling directory case conflict: %s (left) vs %s (right)",
+            left_case,
+            right_case,
+        )
 
         # Create a special DIR_CASE_CONFLICT job that will rename the directory
         # We'll use left side's case as the canonical case (left-wins strategy)
@@ -872,7 +1087,10 @@ class SyncEngine:
 
         # Use left as the "winner" and save right as conflict file
         logger.info(
-            f"Handling rename conflict: {old_path} -> {left_new} (left) vs {right_new} (right)"
+            "Handling rename conflict: %s -> %s (left) vs %s (right)",
+            old_path,
+            left_new,
+            right_new,
         )
 
         # Strategy: Create a special RENAME_CONFLICT action that will:
@@ -951,59 +1169,22 @@ class SyncEngine:
         Returns:
             List of sync jobs for this conflict
         """
-        jobs = []
-
-        # Determine policy based on conflict type
-        if conflict_type == ConflictType.MODIFY_MODIFY:
-            policy_str = self.config.conflict_policy_modify_modify
-        elif conflict_type == ConflictType.NEW_NEW:
-            policy_str = self.config.conflict_policy_new_new
-        else:
-            policy_str = self.config.conflict_policy_metadata_conflict
-
-        # Convert policy string to enum
-        policy = {
-            "clash": ConflictResolution.CLASH,
-            "notify_only": ConflictResolution.NOTIFY_ONLY,
-            "overwrite_newer": ConflictResolution.OVERWRITE_NEWER,
-        }.get(policy_str, ConflictResolution.CLASH)
-
+        policy = self._conflict_resolutions[conflict_type]
         action = self.conflict_detector.resolve_conflict(file_path, conflict_type, policy)
 
-        if action == "CLASH_CREATE":
-            jobs.append(
-                SyncJob(
-                    action=SyncAction.CLASH_CREATE,
-                    file_path=file_path,
-                    details=f"Conflict type: {conflict_type.value}",
-                )
-            )
-        elif action == "COPY_LEFT_TO_RIGHT":
-            jobs.append(
-                SyncJob(
-                    action=SyncAction.COPY_LEFT_TO_RIGHT,
-                    file_path=file_path,
-                    details=f"Resolved conflict ({conflict_type.value}): newer on left",
-                )
-            )
-        elif action == "COPY_RIGHT_TO_LEFT":
-            jobs.append(
-                SyncJob(
-                    action=SyncAction.COPY_RIGHT_TO_LEFT,
-                    file_path=file_path,
-                    details=f"Resolved conflict ({conflict_type.value}): newer on right",
-                )
-            )
-        elif action == "NOTIFY":
-            jobs.append(
-                SyncJob(
-                    action=SyncAction.NOOP,
-                    file_path=file_path,
-                    details=f"Conflict detected, notify only: {conflict_type.value}",
-                )
-            )
+        conflict_action = _CONFLICT_ACTIONS.get(action)
+        if conflict_action is None:
+            # NOOP / no resolution - nothing to do
+            return []
 
-        return jobs
+        sync_action, details = conflict_action
+        return [
+            SyncJob(
+                action=sync_action,
+                file_path=file_path,
+                details=details.format(conflict_type.value),
+            )
+        ]
 
     def _apply_sync_rules(
         self, file_path: str, prev_metadata: Optional[FileMetadata], curr_metadata: FileMetadata
@@ -1080,150 +1261,62 @@ class SyncEngine:
             # Directory exists on both sides -> no action needed
             return jobs
 
-        # Rule: File only on left
-        if curr_metadata.exists_left and not curr_metadata.exists_right:
-            if prev_metadata is None:
-                # New file on left only
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_LEFT_TO_RIGHT,
-                        file_path=file_path,
-                        details="New file on left",
-                    )
-                )
-            elif prev_metadata.exists_right and not curr_metadata.exists_right:
-                # Deleted on right, unchanged or changed on left
-                if prev_metadata.mtime_left == curr_metadata.mtime_left:
-                    # Unchanged on left, deleted on right → follow right's deletion
-                    if self.config.soft_delete_enabled and (
-                        self.config.soft_delete_max_size_bytes is None
-                        or (prev_metadata.size_right or 0) <= self.config.soft_delete_max_size_bytes
-                    ):
-                        jobs.append(
-                            SyncJob(
-                                action=SyncAction.SOFT_DELETE_LEFT,
-                                file_path=file_path,
-                                details="Deleted on right (unchanged on left)",
-                            )
-                        )
-                    else:
-                        jobs.append(
-                            SyncJob(
-                                action=SyncAction.DELETE_LEFT,
-                                file_path=file_path,
-                                details="Deleted on right (unchanged on left)",
-                            )
-                        )
-                else:
-                    # Changed on left, deleted on right → copy left (left authoritative)
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.COPY_LEFT_TO_RIGHT,
-                            file_path=file_path,
-                            details="Deleted on right but changed on left",
-                        )
-                    )
-            else:
-                # File exists only on left, and did before too → sync asymmetry, copy to right
-                # This handles orphaned files (e.g., old conflict files created before fixes)
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_LEFT_TO_RIGHT,
-                        file_path=file_path,
-                        details="File exists only on left (asymmetry fix)",
-                    )
-                )
-
-        # Rule: File only on right
-        elif curr_metadata.exists_right and not curr_metadata.exists_left:
-            if prev_metadata is None:
-                # New file on right only
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_RIGHT_TO_LEFT,
-                        file_path=file_path,
-                        details="New file on right",
-                    )
-                )
-            elif prev_metadata.exists_left and not curr_metadata.exists_left:
-                # Deleted on left, unchanged or changed on right
-                if prev_metadata.mtime_right == curr_metadata.mtime_right:
-                    # Unchanged on right, deleted on left → follow left's deletion
-                    if self.config.soft_delete_enabled and (
-                        self.config.soft_delete_max_size_bytes is None
-                        or (prev_metadata.size_left or 0) <= self.config.soft_delete_max_size_bytes
-                    ):
-                        jobs.append(
-                            SyncJob(
-                                action=SyncAction.SOFT_DELETE_RIGHT,
-                                file_path=file_path,
-                                details="Deleted on left (unchanged on right)",
-                            )
-                        )
-                    else:
-                        jobs.append(
-                            SyncJob(
-                                action=SyncAction.DELETE_RIGHT,
-                                file_path=file_path,
-                                details="Deleted on left (unchanged on right)",
-                            )
-                        )
-                else:
-                    # Changed on right, deleted on left → copy right (right authoritative)
-                    jobs.append(
-                        SyncJob(
-                            action=SyncAction.COPY_RIGHT_TO_LEFT,
-                            file_path=file_path,
-                            details="Deleted on left but changed on right",
-                        )
-                    )
-            else:
-                # File exists only on right, and did before too → sync asymmetry, copy to left
-                # This handles orphaned files (e.g., old conflict files created before fixes)
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_RIGHT_TO_LEFT,
-                        file_path=file_path,
-                        details="File exists only on right (asymmetry fix)",
-                    )
-                )
-
-        # Rule: File on both sides but only one changed
-        elif curr_metadata.exists_left and curr_metadata.exists_right:
-            left_changed = prev_metadata and (
-                (curr_metadata.mtime_left or 0) > (prev_metadata.mtime_left or 0)
-            )
-            right_changed = prev_metadata and (
-                (curr_metadata.mtime_right or 0) > (prev_metadata.mtime_right or 0)
-            )
-
-            # Debug logging for change detection
+        # Files: classify the change, then look the decision up in _FILE_RULES
+        exists_left = curr_metadata.exists_left
+        exists_right = curr_metadata.exists_right
+        mtime_left = curr_metadata.mtime_left
+        mtime_right = curr_metadata.mtime_right
+        state = 0
+        if exists_left and exists_right:
             if prev_metadata:
-                logger.debug(f"Change detection for {file_path}:")
+                prev_mtime_left = prev_metadata.mtime_left
+                prev_mtime_right = prev_metadata.mtime_right
+                left_changed = mtime_left > prev_mtime_left
+                right_changed = mtime_right > prev_mtime_right
+
+                # Debug logging for change detection
+                logger.debug("Change detection for %s:", file_path)
                 logger.debug(
-                    f"  Left: prev_mtime={prev_metadata.mtime_left}, "
-                    f"curr_mtime={curr_metadata.mtime_left}, changed={left_changed}"
+                    "  Left: prev_mtime=%s, curr_mtime=%s, changed=%s",
+                    prev_mtime_left,
+                    mtime_left,
+                    left_changed,
                 )
                 logger.debug(
-                    f"  Right: prev_mtime={prev_metadata.mtime_right}, "
-                    f"curr_mtime={curr_metadata.mtime_right}, changed={right_changed}"
+                    "  Right: prev_mtime=%s, curr_mtime=%s, changed=%s",
+                    prev_mtime_right,
+                    mtime_right,
+                    right_changed,
                 )
+                state = (left_changed << 1) | right_changed
+        elif prev_metadata is not None:
+            if exists_left:
+                # Left authoritative if it changed since the right-side deletion
+                if not prev_metadata.exists_right:
+                    state = 3
+                elif prev_metadata.mtime_left == mtime_left:
+                    state = 1
+                else:
+                    state = 2
+            elif exists_right:
+                # Right authoritative if it changed since the left-side deletion
+                if not prev_metadata.exists_left:
+                    state = 3
+                elif prev_metadata.mtime_right == mtime_right:
+                    state = 1
+                else:
+                    state = 2
 
-            if left_changed and not right_changed:
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_LEFT_TO_RIGHT,
-                        file_path=file_path,
-                        details="Changed only on left",
-                    )
-                )
-            elif right_changed and not left_changed:
-                jobs.append(
-                    SyncJob(
-                        action=SyncAction.COPY_RIGHT_TO_LEFT,
-                        file_path=file_path,
-                        details="Changed only on right",
-                    )
-                )
+        rule = _FILE_RULES.get((exists_left << 3) | (exists_right << 2) | state)
+        if rule is None:
+            return jobs
+
+        action, details = rule
+        soft_delete = _SOFT_DELETES.get(action)
+        if soft_delete is not None:
+            soft_action, deleted_size = soft_delete
+            if deleted_size(prev_metadata) <= self._soft_delete_threshold:
+                action = soft_action
+        jobs.append(SyncJob(action=action, file_path=file_path, details=details))
 
         return jobs
@@ -366,6 +366,30 @@ def test_case_conflict_right_newer(config):
     assert conflict_jobs[0].file_path in ["FILE.txt", "file.txt"]
 
 
+def test_case_conflict_payload_mtime_unknown_when_variant_missing(config):
+    """A variant with no side to read an mtime from gets None, not a 0.0 sentinel."""
+    current_state = {
+        "FILE.txt": FileMetadata(
+            relative_path="FILE.txt",
+            exists_left=True,
+            exists_right=False,
+            mtime_left=110.0,
+            size_left=10,
+        ),
+        "File.txt": FileMetadata(
+            relative_path="File.txt",
+            exists_left=False,
+            exists_right=False,
+        ),
+    }
+
+    engine = SyncEngine(config, {}, current_state)
+    (job,) = engine._handle_case_conflict("file.txt", "FILE.txt", "File.txt")
+
+    assert job.payload.left_mtime == 110.0
+    assert job.payload.right_mtime is None
+
+
 def test_multiple_case_conflicts_in_one_run(config):
     """Ensure multiple independent case conflicts produce multiple jobs."""
     previous_state = {
@@ -433,3 +457,59 @@ def test_multiple_case_conflicts_in_one_run(config):
 
     conflict_jobs = [j for j in jobs if j.action == SyncAction.CASE_CONFLICT]
     assert len(conflict_jobs) == 2
+
+
+def test_many_case_conflicts_snapshot_each_variant(tmp_path):
+    """Test that snapshots read in a batch land on the matching conflict jobs."""
+    left_root = tmp_path / "left"
+    right_root = tmp_path / "right"
+    left_root.mkdir()
+    right_root.mkdir()
+    config = Config(
+        {
+            "left_root": str(left_root),
+            "right_root": str(right_root),
+            "ignore": {},
+            "soft_delete": {"enabled": True, "max_size_mb": 20},
+            "conflict_policy": {},
+        }
+    )
+
+    previous_state = {}
+    current_state = {}
+    for i in range(6):
+        (left_root / f"FILE{i}.txt").write_bytes(f"left{i}".encode())
+        (right_root / f"File{i}.txt").write_bytes(f"right{i}".encode())
+        previous_state[f"file{i}.txt"] = FileMetadata(
+            relative_path=f"file{i}.txt",
+            exists_left=True,
+            exists_right=True,
+            mtime_left=100.0,
+            mtime_right=100.0,
+            size_left=5,
+            size_right=5,
+        )
+        current_state[f"FILE{i}.txt"] = FileMetadata(
+            relative_path=f"FILE{i}.txt",
+            exists_left=True,
+            exists_right=False,
+            mtime_left=100.0,
+            size_left=5,
+        )
+        current_state[f"File{i}.txt"] = FileMetadata(
+            relative_path=f"File{i}.txt",
+            exists_left=False,
+            exists_right=True,
+            mtime_right=100.0,
+            size_right=6,
+        )
+
+    engine = SyncEngine(config, previous_state, current_state)
+    jobs = engine.generate_sync_jobs()
+
+    conflict_jobs = [j for j in jobs if j.action == SyncAction.CASE_CONFLICT]
+    assert len(conflict_jobs) == 6
+    for job in conflict_jobs:
+        i = job.file_path[len("FILE") : -len(".txt")]
+        assert job.payload.left_bytes == f"left{i}".encode()
+        assert job.payload.right_bytes == f"right{i}".encode()
@@ -208,3 +208,49 @@ class TestConflictDetector:
 
         # Should detect as conflict due to size mismatch
         assert len(conflicts) >= 0  # Depends on size threshold
+
+    def test_iter_conflicts_yields_each_path_once_with_final_type(self):
+        """Test that iter_conflicts yields one final entry per conflicting path."""
+        previous = {
+            "both.txt": FileMetadata(
+                relative_path="both.txt",
+                exists_left=True,
+                exists_right=True,
+                mtime_left=1000.0,
+                mtime_right=1000.0,
+                size_left=100,
+                size_right=100,
+            ),
+        }
+        current = {
+            # Modified on both sides with very different sizes: modify-modify, then metadata
+            "both.txt": FileMetadata(
+                relative_path="both.txt",
+                exists_left=True,
+                exists_right=True,
+                mtime_left=2000.0,
+                mtime_right=2000.0,
+                size_left=100,
+                size_right=500,
+            ),
+            "new.txt": FileMetadata(
+                relative_path="new.txt",
+                exists_left=True,
+                exists_right=True,
+                mtime_left=1000.0,
+                mtime_right=5000.0,
+                size_left=10,
+                size_right=20,
+            ),
+        }
+
+        detector = ConflictDetector(previous, current)
+        yielded = [(path, conflict_type) for path, conflict_type, _, _ in detector.iter_conflicts()]
+
+        assert yielded == [
+            ("both.txt", ConflictType.METADATA_CONFLICT),
+            ("new.txt", ConflictType.NEW_NEW),
+        ]
+        assert {path: entry[0] for path, entry in detector.detect_conflicts().items()} == dict(
+            yielded
+        )
@@ -9,7 +9,7 @@ from remote_office_sync.config_loader import Config
 from remote_office_sync.file_ops import FileOps
 from remote_office_sync.main import SyncRunner
 from remote_office_sync.state_db import StateDB
-from remote_office_sync.sync_logic import SyncAction
+from remote_office_sync.sync_logic import CaseConflictPayload, SyncAction
 
 
 @pytest.fixture
@@ -105,7 +105,9 @@ def test_case_conflict_keeps_newer_casing_and_conflict_artifacts(runner):
         action=SyncAction.CASE_CONFLICT,
         file_path="CaseTest.txt",
         src_path="casetest.txt",
-        payload={"left_mtime": float(left_ts), "right_mtime": float(right_ts)},
+        payload=CaseConflictPayload(
+            prev_path="CaseTest.txt", left_mtime=float(left_ts), right_mtime=float(right_ts)
+        ),
     )
 
     assert instance._execute_job(job) is True
@@ -1,5 +1,10 @@
 """Tests for the scanner module."""
 
+import logging
+import os
+
+import pytest
+
 from remote_office_sync.scanner import Scanner
 
 
@@ -80,6 +85,71 @@ class TestScanner:
         assert "keep.txt" in result
         assert "thumbs.db" not in result
 
+    def test_ignored_directory_not_descended(self, temp_dirs):
+        """Test that nothing under an ignored directory is reported."""
+        left, _ = temp_dirs
+        (left / "keep.txt").write_text("keep")
+        ignored = left / "System Volume Information"
+        (ignored / "nested").mkdir(parents=True)
+        (ignored / "inside.txt").write_text("ignore")
+        (ignored / "nested" / "deep.txt").write_text("ignore")
+
+        scanner = Scanner(ignore_directories=["system volume information"])
+        result = scanner.scan_directory(str(left))
+
+        assert set(result) == {"keep.txt"}
+
+    def test_nested_empty_directories_report_deepest(self, temp_dirs):
+        """Test that only the innermost of nested empty directories is reported."""
+        left, _ = temp_dirs
+        (left / "a" / "b" / "c").mkdir(parents=True)
+
+        scanner = Scanner()
+        result = scanner.scan_directory(str(left))
+
+        assert set(result) == {"a/b/c"}
+        assert result["a/b/c"][1] == -1
+
+    def test_symlinked_directory_not_followed(self, temp_dirs):
+        """Test that a symlink to a directory is not descended into."""
+        left, right = temp_dirs
+        target = right / "target"
+        target.mkdir()
+        (target / "linked.txt").write_text("data")
+        (left / "real.txt").write_text("data")
+        try:
+            os.symlink(target, left / "link", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Could not create directory symlink")
+
+        scanner = Scanner()
+        result = scanner.scan_directory(str(left))
+
+        assert set(result) == {"real.txt"}
+
+    def test_unreadable_subdirectory_skipped(self, temp_dirs, monkeypatch, caplog):
+        """Test that a subdirectory that cannot be listed is logged and skipped."""
+        left, _ = temp_dirs
+        (left / "ok").mkdir()
+        (left / "ok" / "file.txt").write_text("data")
+        (left / "locked").mkdir()
+        (left / "locked" / "secret.txt").write_text("data")
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        scanner = Scanner()
+        with caplog.at_level(logging.WARNING, logger="sync"):
+            result = scanner.scan_directory(str(left))
+
+        assert set(result) == {"ok/file.txt"}
+        assert "Could not scan directory locked" in caplog.text
+
     def test_merge_scans(self, temp_dirs):
         """Test merging left and right scans."""
         left, right = temp_dirs
@@ -110,3 +180,29 @@ class TestScanner:
         assert both_path
         assert merged[both_path].exists_left
         assert merged[both_path].exists_right
+
+    def test_merge_scans_missing_side_uses_zero_sentinels(self):
+        """Test that a side the file is missing from gets zero sentinels, not None."""
+        scanner = Scanner()
+        merged = scanner.merge_scans({"left.txt": (1000.0, 10, 0x01)}, {})
+
+        metadata = merged["left.txt"]
+        assert metadata.exists_left
+        assert not metadata.exists_right
+        assert metadata.mtime_right == 0.0
+        assert metadata.size_right == 0
+        assert metadata.attrs_right == 0
+
+    def test_merge_scans_accepts_tuples_without_attrs(self):
+        """Test that (mtime, size) scan tuples merge with attrs defaulting to 0."""
+        scanner = Scanner()
+        merged = scanner.merge_scans(
+            {"both.txt": (1000.0, 10), "left.txt": (1000.0, 5)},
+            {"both.txt": (1000.0, 10), "right.txt": (2000.0, 7)},
+        )
+
+        assert merged["both.txt"].attrs_left == 0
+        assert merged["both.txt"].attrs_right == 0
+        assert merged["left.txt"].attrs_left == 0
+        assert merged["right.txt"].attrs_right == 0
+        assert merged["right.txt"].size_right == 7
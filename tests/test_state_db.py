@@ -1,5 +1,7 @@
 """Tests for state database module."""
 
+import sqlite3
+
 from remote_office_sync.scanner import FileMetadata
 from remote_office_sync.state_db import StateDB
 
@@ -114,3 +116,102 @@ class TestStateDB:
         loaded = db.load_state()
         assert isinstance(loaded, dict)
         assert len(loaded) == 0
+
+    def test_close_persists_state_and_is_idempotent(self, tmp_path):
+        """Test that state survives close() and closing twice is harmless."""
+        db_path = tmp_path / "test.db"
+        db = StateDB(str(db_path))
+        db.save_state(
+            {
+                "file1.txt": FileMetadata(
+                    relative_path="file1.txt",
+                    exists_left=True,
+                    exists_right=False,
+                    mtime_left=1000.0,
+                    size_left=100,
+                ),
+            }
+        )
+        db.close()
+        db.close()
+
+        reopened = StateDB(str(db_path))
+        assert "file1.txt" in reopened.load_state()
+        reopened.close()
+
+    def test_use_after_close_reopens_connection(self, tmp_path):
+        """Test that calls after close() reconnect instead of failing."""
+        db_path = tmp_path / "test.db"
+        db = StateDB(str(db_path))
+        db.close()
+
+        db.save_state(
+            {
+                "file1.txt": FileMetadata(
+                    relative_path="file1.txt",
+                    exists_left=True,
+                    exists_right=False,
+                    mtime_left=1000.0,
+                    size_left=100,
+                ),
+            }
+        )
+        db.close()
+        assert db.get_file_state("file1.txt").size_left == 100
+        db.close()
+        assert set(db.load_state()) == {"file1.txt"}
+        db.close()
+        db.clear_state()
+        assert db.load_state() == {}
+        db.close()
+
+    def test_incremental_save_applies_changes_and_removals(self, tmp_path):
+        """Test that a save after load writes additions, updates and removals."""
+        db_path = tmp_path / "test.db"
+        db = StateDB(str(db_path))
+
+        def entry(path, mtime):
+            return FileMetadata(
+                relative_path=path,
+                exists_left=True,
+                exists_right=True,
+                mtime_left=mtime,
+                mtime_right=mtime,
+                size_left=10,
+                size_right=10,
+            )
+
+        db.save_state({"keep.txt": entry("keep.txt", 1.0), "gone.txt": entry("gone.txt", 1.0)})
+        db.load_state()
+        db.save_state({"keep.txt": entry("keep.txt", 2.0), "new.txt": entry("new.txt", 3.0)})
+        db.close()
+
+        loaded = StateDB(str(db_path)).load_state()
+        assert set(loaded) == {"keep.txt", "new.txt"}
+        assert loaded["keep.txt"].mtime_left == 2.0
+        assert loaded["new.txt"].mtime_left == 3.0
+
+    def test_migrates_legacy_v1_database(self, tmp_path):
+        """Test that an unversioned 7-column database is upgraded in place."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE files (path TEXT PRIMARY KEY, exists_left INTEGER, "
+            "exists_right INTEGER, mtime_left REAL, mtime_right REAL, "
+            "size_left INTEGER, size_right INTEGER)"
+        )
+        conn.execute("INSERT INTO files VALUES ('old.txt', 1, 1, 1000.0, 1000.0, 5, 5)")
+        conn.commit()
+        conn.close()
+
+        db = StateDB(str(db_path))
+        loaded = db.load_state()
+
+        assert loaded["old.txt"].size_left == 5
+        assert loaded["old.txt"].attrs_left == 0
+        db.close()
+
+        conn = sqlite3.connect(str(db_path))
+        (schema,) = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'files'").fetchone()
+        conn.close()
+        assert "WITHOUT ROWID" in schema
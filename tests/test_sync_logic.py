@@ -98,10 +98,7 @@ class TestSyncEngine:
 
         # Size difference triggers metadata conflict which defaults to clash
         assert len(jobs) == 1
-        assert jobs[0].action in [
-            SyncAction.COPY_LEFT_TO_RIGHT,
-            SyncAction.CLASH_CREATE,
-        ]
+        assert jobs[0].action == SyncAction.CLASH_CREATE
 
     def test_deleted_on_left_unchanged_on_right(self, test_config):
         """Test file deleted on left, unchanged on right."""
@@ -129,11 +126,9 @@ class TestSyncEngine:
         engine = SyncEngine(test_config, previous, current)
         jobs = engine.generate_sync_jobs()
 
+        # 100 bytes is under the 20 MB soft-delete limit
         assert len(jobs) == 1
-        assert jobs[0].action in [
-            SyncAction.DELETE_RIGHT,
-            SyncAction.SOFT_DELETE_RIGHT,
-        ]
+        assert jobs[0].action == SyncAction.SOFT_DELETE_RIGHT
 
     def test_deleted_on_left_changed_on_right(self, test_config):
         """Test file deleted on left but changed on right."""
@@ -194,3 +189,184 @@ class TestSyncEngine:
 
         # No jobs should be generated
         assert len(jobs) == 0
+
+    def test_iter_sync_jobs_matches_generate_sync_jobs(self, test_config):
+        """Test that the lazy job stream yields the same jobs in the same order."""
+        previous = {}
+        current = {
+            "left.txt": FileMetadata(
+                relative_path="left.txt",
+                exists_left=True,
+                exists_right=False,
+                mtime_left=1000.0,
+                size_left=100,
+            ),
+            "right.txt": FileMetadata(
+                relative_path="right.txt",
+                exists_left=False,
+                exists_right=True,
+                mtime_right=1000.0,
+                size_right=100,
+            ),
+        }
+
+        engine = SyncEngine(test_config, previous, current)
+        stream = engine.iter_sync_jobs()
+
+        assert not isinstance(stream, list)
+        streamed = [(job.action, job.file_path) for job in stream]
+        generated = [(job.action, job.file_path) for job in engine.generate_sync_jobs()]
+        assert streamed == generated
+        assert streamed == [
+            (SyncAction.COPY_LEFT_TO_RIGHT, "left.txt"),
+            (SyncAction.COPY_RIGHT_TO_LEFT, "right.txt"),
+        ]
+
+    @pytest.mark.parametrize(
+        "prev_sides, curr_sides, expected",
+        [
+            # (exists_left, exists_right, mtime_left, mtime_right); sizes are 100 per side
+            (None, (True, False, 1000.0, 0.0), SyncAction.COPY_LEFT_TO_RIGHT),
+            (None, (False, True, 0.0, 1000.0), SyncAction.COPY_RIGHT_TO_LEFT),
+            ((True, True, 1000.0, 1000.0), (True, False, 1000.0, 0.0), SyncAction.SOFT_DELETE_LEFT),
+            (
+                (True, True, 1000.0, 1000.0),
+                (False, True, 0.0, 1000.0),
+                SyncAction.SOFT_DELETE_RIGHT,
+            ),
+            (
+                (True, True, 1000.0, 1000.0),
+                (True, False, 2000.0, 0.0),
+                SyncAction.COPY_LEFT_TO_RIGHT,
+            ),
+            (
+                (True, True, 1000.0, 1000.0),
+                (False, True, 0.0, 2000.0),
+                SyncAction.COPY_RIGHT_TO_LEFT,
+            ),
+            (
+                (True, False, 1000.0, 0.0),
+                (True, False, 1000.0, 0.0),
+                SyncAction.COPY_LEFT_TO_RIGHT,
+            ),
+            (
+                (False, True, 0.0, 1000.0),
+                (False, True, 0.0, 1000.0),
+                SyncAction.COPY_RIGHT_TO_LEFT,
+            ),
+            (
+                (True, True, 1000.0, 1000.0),
+                (True, True, 2000.0, 1000.0),
+                SyncAction.COPY_LEFT_TO_RIGHT,
+            ),
+            (
+                (True, True, 1000.0, 1000.0),
+                (True, True, 1000.0, 2000.0),
+                SyncAction.COPY_RIGHT_TO_LEFT,
+            ),
+            ((True, True, 1000.0, 1000.0), (True, True, 2000.0, 3000.0), SyncAction.CLASH_CREATE),
+        ],
+        ids=[
+            "new-left",
+            "new-right",
+            "deleted-right-unchanged-left",
+            "deleted-left-unchanged-right",
+            "deleted-right-changed-left",
+            "deleted-left-changed-right",
+            "left-only-asymmetry",
+            "right-only-asymmetry",
+            "changed-left",
+            "changed-right",
+            "changed-both",
+        ],
+    )
+    def test_file_rule_actions(self, test_config, prev_sides, curr_sides, expected):
+        """Test the exact action produced for each file rule state."""
+
+        def metadata(sides):
+            exists_left, exists_right, mtime_left, mtime_right = sides
+            return FileMetadata(
+                relative_path="file.txt",
+                exists_left=exists_left,
+                exists_right=exists_right,
+                mtime_left=mtime_left,
+                mtime_right=mtime_right,
+                size_left=100 if exists_left else 0,
+                size_right=100 if exists_right else 0,
+            )
+
+        previous = {} if prev_sides is None else {"file.txt": metadata(prev_sides)}
+        current = {"file.txt": metadata(curr_sides)}
+
+        jobs = SyncEngine(test_config, previous, current).generate_sync_jobs()
+
+        assert [job.action for job in jobs] == [expected]
+
+    def test_deleted_on_both_sides(self, test_config):
+        """Test that a file gone from both sides produces no job."""
+        previous = {
+            "file.txt": FileMetadata(
+                relative_path="file.txt",
+                exists_left=True,
+                exists_right=True,
+                mtime_left=1000.0,
+                mtime_right=1000.0,
+                size_left=100,
+                size_right=100,
+            ),
+        }
+
+        engine = SyncEngine(test_config, previous, {})
+        jobs = engine.generate_sync_jobs()
+
+        assert jobs == []
+
+    @pytest.mark.parametrize(
+        "soft_delete, deleted_size, expected",
+        [
+            ({"enabled": False, "max_size_mb": 20}, 100, SyncAction.DELETE_RIGHT),
+            ({"enabled": True, "max_size_mb": None}, 2**40, SyncAction.SOFT_DELETE_RIGHT),
+            ({"enabled": True, "max_size_mb": 20}, 20 * 1024 * 1024, SyncAction.SOFT_DELETE_RIGHT),
+            ({"enabled": True, "max_size_mb": 20}, 20 * 1024 * 1024 + 1, SyncAction.DELETE_RIGHT),
+        ],
+        ids=["disabled", "unlimited", "at-limit", "over-limit"],
+    )
+    def test_soft_delete_threshold(self, soft_delete, deleted_size, expected):
+        """Test soft vs hard delete against the configured size limit."""
+        config = Config(
+            {
+                "left_root": "/tmp/left",
+                "right_root": "/tmp/right",
+                "soft_delete": soft_delete,
+                "conflict_policy": {
+                    "modify_modify": "clash",
+                    "new_new": "clash",
+                    "metadata_conflict": "clash",
+                },
+                "ignore": {},
+            }
+        )
+        previous = {
+            "file.txt": FileMetadata(
+                relative_path="file.txt",
+                exists_left=True,
+                exists_right=True,
+                mtime_left=1000.0,
+                mtime_right=1000.0,
+                size_left=deleted_size,
+                size_right=deleted_size,
+            ),
+        }
+        current = {
+            "file.txt": FileMetadata(
+                relative_path="file.txt",
+                exists_left=False,
+                exists_right=True,
+                mtime_right=1000.0,
+                size_right=deleted_size,
+            ),
+        }
+
+        jobs = SyncEngine(config, previous, current).generate_sync_jobs()
+
+        assert [job.action for job in jobs] == [expected]